@@ -11,27 +11,23 @@ Este módulo demuestra diferentes técnicas para detectar outliers:
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
 from sklearn.ensemble import IsolationForest
 from sklearn.preprocessing import StandardScaler
-from scipy import stats
-import warnings
-warnings.filterwarnings('ignore')
+from joblib import parallel_backend
 
-# Configuración para visualizaciones
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+from utilidades import dataset_cacheado, preparar_estilo_graficos
 
+@dataset_cacheado
 def crear_datos_ejemplo():
     """Crea un dataset de ejemplo con outliers para demostración"""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     # Datos normales
     datos_normales = {
-        'precio': np.random.normal(50, 15, 200),
-        'cantidad': np.random.poisson(5, 200),
-        'descuento': np.random.beta(2, 5, 200),
-        'edad_cliente': np.random.normal(35, 10, 200)
+        'precio': rng.normal(50, 15, 200),
+        'cantidad': rng.poisson(5, 200),
+        'descuento': rng.beta(2, 5, 200),
+        'edad_cliente': rng.normal(35, 10, 200)
     }
     
     # Agregar outliers intencionalmente
@@ -42,14 +38,79 @@ def crear_datos_ejemplo():
         'edad_cliente': [120, 5, 200, 0]
     }
     
-    df_normales = pd.DataFrame(datos_normales)
-    df_outliers = pd.DataFrame(outliers)
+    # Unir cada columna en un solo array y construir el DataFrame una vez
+    columnas = {
+        col: np.concatenate([valores, outliers[col]])
+        for col, valores in datos_normales.items()
+    }
+    n_filas = len(columnas['precio'])
+    columnas['id'] = np.arange(n_filas)
+    
+    df_completo = pd.DataFrame(columnas)
     
-    df_completo = pd.concat([df_normales, df_outliers], ignore_index=True)
-    df_completo['id'] = range(len(df_completo))
+    # Reducir los tipos numéricos (float32 y enteros pequeños): menos
+    # memoria que recorrer en los cálculos de outliers
+    df_completo = df_completo.apply(
+        lambda serie: pd.to_numeric(
+            serie, downcast='float' if serie.dtype.kind == 'f' else 'integer'
+        )
+    )
     
     return df_completo
 
+def _mascara_zscore(valores, threshold=3):
+    """Máscara de filas con algún |z| > threshold sobre un bloque NumPy 2D"""
+    # Centrar una sola vez: la desviación (ddof=0, como scipy.stats.zscore)
+    # reutiliza la media ya calculada en lugar de recalcularla como nanstd
+    centrados = valores - np.nanmean(valores, axis=0)
+    desviacion = np.sqrt(np.nanmean(centrados ** 2, axis=0))
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z_scores = np.abs(centrados) / desviacion
+    
+    # Los NaN (valores ausentes o columnas constantes) nunca son outliers
+    return (z_scores > threshold).any(axis=1)
+
+def _mascara_iqr(valores, factor=1.5):
+    """Máscara de filas fuera de [Q1 - factor*IQR, Q3 + factor*IQR] en alguna columna"""
+    # Cuartiles de todas las columnas en una sola llamada (ignorando NaN)
+    Q1, Q3 = np.nanquantile(valores, [0.25, 0.75], axis=0)
+    IQR = Q3 - Q1
+    
+    # Intervalo simétrico respecto al centro de la caja: una resta y una
+    # comparación en lugar de dos comparaciones y un OR
+    centro = (Q1 + Q3) * 0.5
+    semiancho = (factor + 0.5) * IQR
+    
+    return (np.abs(valores - centro) > semiancho).any(axis=1)
+
+def _mascara_isolation_forest(valores, contamination=0.1):
+    """Máscara de filas marcadas como outlier por Isolation Forest"""
+    outliers_isolation = np.zeros(len(valores), dtype=bool)
+    
+    # Isolation Forest no admite NaN: solo se analizan las filas completas
+    filas_validas = ~np.isnan(valores).any(axis=1)
+    if not filas_validas.any():
+        return outliers_isolation
+    
+    iso_forest = IsolationForest(
+        contamination=contamination, 
+        random_state=42,
+        n_estimators=100,
+        n_jobs=-1  # Construir y evaluar los árboles en paralelo
+    )
+    
+    # Los árboles trabajan en float32: convertir una sola vez a un bloque
+    # contiguo evita copias intermedias dentro de scikit-learn
+    X = np.ascontiguousarray(valores[filas_validas], dtype=np.float32)
+    
+    # Hilos en lugar de procesos: los workers comparten X sin copiarlo
+    with parallel_backend('threading'):
+        outliers = iso_forest.fit_predict(X)
+    
+    outliers_isolation[filas_validas] = outliers == -1
+    return outliers_isolation
+
 def detectar_outliers_zscore(df, columnas, threshold=3):
     """
     Detecta outliers usando Z-score
@@ -63,12 +124,10 @@ def detectar_outliers_zscore(df, columnas, threshold=3):
         DataFrame con columna 'outlier_zscore' indicando outliers
     """
     df_resultado = df.copy()
-    df_resultado['outlier_zscore'] = False
     
-    for col in columnas:
-        z_scores = np.abs(stats.zscore(df[col].dropna()))
-        outliers_mask = z_scores > threshold
-        df_resultado.loc[outliers_mask, 'outlier_zscore'] = True
+    # Todas las columnas a la vez sobre un único bloque NumPy
+    valores = df[columnas].to_numpy(dtype=float)
+    df_resultado['outlier_zscore'] = _mascara_zscore(valores, threshold)
     
     return df_resultado
 
@@ -85,18 +144,9 @@ def detectar_outliers_iqr(df, columnas, factor=1.5):
         DataFrame con columna 'outlier_iqr' indicando outliers
     """
     df_resultado = df.copy()
-    df_resultado['outlier_iqr'] = False
     
-    for col in columnas:
-        Q1 = df[col].quantile(0.25)
-        Q3 = df[col].quantile(0.75)
-        IQR = Q3 - Q1
-        
-        lower_bound = Q1 - factor * IQR
-        upper_bound = Q3 + factor * IQR
-        
-        outliers_mask = (df[col] < lower_bound) | (df[col] > upper_bound)
-        df_resultado.loc[outliers_mask, 'outlier_iqr'] = True
+    valores = df[columnas].to_numpy(dtype=float)
+    df_resultado['outlier_iqr'] = _mascara_iqr(valores, factor)
     
     return df_resultado
 
@@ -114,26 +164,10 @@ def detectar_outliers_isolation_forest(df, columnas, contamination=0.1):
     """
     df_resultado = df.copy()
     
-    # Preparar datos para Isolation Forest
-    datos_para_analisis = df[columnas].dropna()
-    
-    if len(datos_para_analisis) == 0:
-        df_resultado['outlier_isolation'] = False
-        return df_resultado
-    
-    # Aplicar Isolation Forest
-    iso_forest = IsolationForest(
-        contamination=contamination, 
-        random_state=42,
-        n_estimators=100
-    )
-    
-    outliers = iso_forest.fit_predict(datos_para_analisis)
-    
-    # Crear máscara de outliers
-    df_resultado['outlier_isolation'] = False
-    indices_validos = datos_para_analisis.index
-    df_resultado.loc[indices_validos[outliers == -1], 'outlier_isolation'] = True
+    # Isolation Forest trabaja en float32: extraer el bloque directamente en
+    # ese tipo evita pasar por una copia intermedia en float64
+    valores = df[columnas].to_numpy(dtype=np.float32)
+    df_resultado['outlier_isolation'] = _mascara_isolation_forest(valores, contamination)
     
     return df_resultado
 
@@ -151,16 +185,16 @@ def comparar_metodos_outliers(df, columnas):
     print("🔍 COMPARACIÓN DE MÉTODOS DE DETECCIÓN DE OUTLIERS")
     print("=" * 60)
     
-    # Aplicar todos los métodos
-    df_zscore = detectar_outliers_zscore(df, columnas)
-    df_iqr = detectar_outliers_iqr(df, columnas)
-    df_isolation = detectar_outliers_isolation_forest(df, columnas)
+    # Aplicar todos los métodos sobre el mismo bloque NumPy
+    valores = df[columnas].to_numpy(dtype=float)
     
-    # Combinar resultados
-    df_comparacion = df.copy()
-    df_comparacion['outlier_zscore'] = df_zscore['outlier_zscore']
-    df_comparacion['outlier_iqr'] = df_iqr['outlier_iqr']
-    df_comparacion['outlier_isolation'] = df_isolation['outlier_isolation']
+    # Añadir las tres máscaras (arrays NumPy, sin alinear índices) de una
+    # vez; assign ya devuelve una copia de df
+    df_comparacion = df.assign(
+        outlier_zscore=_mascara_zscore(valores),
+        outlier_iqr=_mascara_iqr(valores),
+        outlier_isolation=_mascara_isolation_forest(valores)
+    )
     
     # Calcular estadísticas
     total_outliers = {
@@ -187,7 +221,9 @@ def visualizar_outliers(df, columnas, metodo='isolation'):
         columnas: Lista de columnas a visualizar
         metodo: Método de detección a visualizar
     """
-    fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+    preparar_estilo_graficos()
+    
+    fig, axes = plt.subplots(2, 2, figsize=(15, 10), constrained_layout=True)
     axes = axes.ravel()
     
     for i, col in enumerate(columnas[:4]):
@@ -202,7 +238,8 @@ def visualizar_outliers(df, columnas, metodo='isolation'):
             df[~outliers_mask][col], 
             alpha=0.6, 
             label='Normal',
-            color='blue'
+            color='blue',
+            rasterized=True
         )
         
         # Outliers
@@ -212,7 +249,8 @@ def visualizar_outliers(df, columnas, metodo='isolation'):
             alpha=0.8, 
             label='Outlier',
             color='red',
-            s=100
+            s=100,
+            rasterized=True
         )
         
         ax.set_title(f'Outliers en {col} ({metodo.upper()})')
@@ -221,8 +259,9 @@ def visualizar_outliers(df, columnas, metodo='isolation'):
         ax.legend()
         ax.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.show()
+    # Con un backend no interactivo (Agg) no hay ventana que mostrar
+    if plt.get_backend().lower() != 'agg':
+        plt.show()
 
 def analizar_outliers_multivariados(df, columnas):
     """
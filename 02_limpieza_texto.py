@@ -12,22 +12,77 @@ Este módulo demuestra técnicas avanzadas para limpiar datos de texto:
 import pandas as pd
 import numpy as np
 import re
+import html
 import unicodedata
 from typing import Optional, List, Dict
-import warnings
-warnings.filterwarnings('ignore')
+
+from utilidades import (
+    RE_EMAIL, RE_ENTIDAD_HTML, RE_ESPACIOS, RE_ETIQUETA_HTML,
+    RE_TELEFONO_ESPANA, a_cadenas_python, limpiar_por_valores_unicos, vista_previa
+)
+
+# Cualquier carácter que no sea un dígito
+_RE_NO_DIGITO = re.compile(r'[^\d]')
+
+# Teléfono español ya reducido a dígitos: prefijo 34 opcional y 9 cifras
+# que empiezan por 6, 7, 8 o 9
+_RE_TELEFONO_DIGITOS = re.compile(r'^(?:34)?[6-9]\d{8}$')
+
+# Código postal de 5 dígitos
+_RE_CODIGO_POSTAL = re.compile(r'\b(\d{5})\b')
+
+# Caracteres de control (ASCII y C1)
+_RE_CARACTERES_CONTROL = re.compile(r'[\x00-\x1f\x7f-\x9f]')
+
+# Caracteres no permitidos en nombres (todo salvo letras, espacios y guiones)
+_RE_NOMBRE_INVALIDO = re.compile(r'[^a-zA-ZáéíóúÁÉÍÓÚñÑüÜ\s\-]')
+
+# Abreviaciones comunes en direcciones y su forma completa
+_ABREVIATURAS_DIRECCION = {
+    'C/': 'Calle ',
+    'Av.': 'Avenida ',
+    'Avda.': 'Avenida ',
+    'Pl.': 'Plaza ',
+    'Pza.': 'Plaza ',
+    'Nº': 'Número ',
+    'N°': 'Número '
+}
+# Alternativa única; las abreviaciones más largas primero para que ganen
+_RE_ABREVIATURAS = re.compile('|'.join(
+    re.escape(abrev)
+    for abrev in sorted(_ABREVIATURAS_DIRECCION, key=len, reverse=True)
+))
+
+def _formato_titulo(textos: pd.Series) -> pd.Series:
+    """
+    Versión vectorizada de str.title que respeta la semántica de Python
+    
+    El kernel de Arrow trata º/ª como separadores de palabra ("2ºb" pasa a
+    "2ºB", mientras que str.title da "2ºb"), ver a_cadenas_python.
+    
+    Args:
+        textos: Serie de texto
+        
+    Returns:
+        Serie en formato título, con el mismo tipo que la original
+    """
+    return a_cadenas_python(textos).str.title().astype(textos.dtype)
 
 class LimpiadorTexto:
     """Clase para limpiar y normalizar datos de texto"""
     
     def __init__(self):
         self.patrones = self._definir_patrones()
+        # Compilar una sola vez los patrones que se usan fila a fila
+        self.regex = {
+            nombre: re.compile(patron) for nombre, patron in self.patrones.items()
+        }
     
     def _definir_patrones(self) -> Dict[str, str]:
         """Define patrones regex para diferentes tipos de datos"""
         return {
-            'telefono_espana': r'^(\+34|0034|34)?[6-9]\d{8}$',
-            'email': r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$',
+            'telefono_espana': RE_TELEFONO_ESPANA.pattern,
+            'email': RE_EMAIL.pattern,
             'dni': r'^\d{8}[TRWAGMYFPDXBNJZSQVHLCKE]$',
             'codigo_postal': r'^\d{5}$',
             'fecha_es': r'^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}$',
@@ -48,7 +103,7 @@ class LimpiadorTexto:
             return None
         
         # Extraer solo números
-        numeros = re.sub(r'[^\d]', '', str(telefono))
+        numeros = _RE_NO_DIGITO.sub('', str(telefono))
         
         # Validar longitud
         if len(numeros) < 9 or len(numeros) > 11:
@@ -61,7 +116,8 @@ class LimpiadorTexto:
             numeros = numeros[4:]
         
         # Verificar que empiece por 6, 7, 8 o 9
-        if not re.match(r'^[6-9]', numeros):
+        # (tras la validación de longitud siempre quedan al menos 5 dígitos)
+        if numeros[0] not in '6789':
             return None
         
         # Formatear como +34-XXX-XXX-XXX
@@ -70,6 +126,31 @@ class LimpiadorTexto:
         
         return None
     
+    def limpiar_telefonos(self, telefonos: pd.Series) -> pd.Series:
+        """
+        Versión vectorizada de limpiar_telefono para una columna completa
+        
+        Args:
+            telefonos: Serie con números de teléfono en cualquier formato
+            
+        Returns:
+            Serie con teléfonos normalizados (None si no son válidos)
+        """
+        # Extraer solo números en una pasada sobre toda la columna
+        numeros = telefonos.str.replace(_RE_NO_DIGITO, '', regex=True)
+        
+        # Longitud, prefijo y primera cifra se validan con una sola regex
+        # (misma lógica que la versión escalar: con prefijo 0034 nunca quedan
+        # 9 cifras dentro del límite de 11)
+        validos = numeros.str.match(_RE_TELEFONO_DIGITOS, na=False)
+        
+        # En los válidos el número son siempre las 9 últimas cifras
+        numeros = numeros.str[-9:]
+        formateados = (
+            '+34-' + numeros.str[:3] + '-' + numeros.str[3:6] + '-' + numeros.str[6:]
+        )
+        return formateados.where(validos, None)
+    
     def limpiar_email(self, email: str) -> Optional[str]:
         """
         Limpia y valida direcciones de email
@@ -87,11 +168,26 @@ class LimpiadorTexto:
         email = str(email).strip().lower()
         
         # Validar formato
-        if not re.match(self.patrones['email'], email):
+        if not self.regex['email'].match(email):
             return None
         
         return email
     
+    def limpiar_emails(self, emails: pd.Series) -> pd.Series:
+        """
+        Versión vectorizada de limpiar_email para una columna completa
+        
+        Args:
+            emails: Serie con direcciones de email
+            
+        Returns:
+            Serie con emails limpios (None si no son válidos)
+        """
+        emails = emails.str.strip().str.lower()
+        validos = emails.str.match(self.regex['email'], na=False)
+        
+        return emails.where(validos, None)
+    
     def limpiar_nombre(self, nombre: str) -> Optional[str]:
         """
         Limpia y normaliza nombres de personas
@@ -105,24 +201,40 @@ class LimpiadorTexto:
         if pd.isna(nombre) or not isinstance(nombre, str):
             return None
         
-        # Limpiar espacios y caracteres especiales
-        nombre = str(nombre).strip()
-        
         # Eliminar caracteres no alfabéticos excepto espacios y guiones
-        nombre = re.sub(r'[^a-zA-ZáéíóúÁÉÍÓÚñÑüÜ\s\-]', '', nombre)
+        nombre = _RE_NOMBRE_INVALIDO.sub('', nombre)
         
-        # Normalizar espacios múltiples
-        nombre = re.sub(r'\s+', ' ', nombre)
+        # Quitar espacios de los extremos y normalizar espacios múltiples
+        # en una sola pasada (split sin argumentos descarta los vacíos)
+        nombre = ' '.join(nombre.split())
         
         # Formato título (primera letra de cada palabra en mayúscula)
         nombre = nombre.title()
         
         # Validar que no esté vacío
-        if not nombre or len(nombre.strip()) < 2:
+        if len(nombre) < 2:
             return None
         
         return nombre
     
+    def limpiar_nombres(self, nombres: pd.Series) -> pd.Series:
+        """
+        Versión vectorizada de limpiar_nombre para una columna completa
+        
+        Args:
+            nombres: Serie con nombres de personas
+            
+        Returns:
+            Serie con nombres limpios (None si no son válidos)
+        """
+        nombres = _formato_titulo(
+            nombres.str.replace(_RE_NOMBRE_INVALIDO, '', regex=True)
+            .str.replace(RE_ESPACIOS, ' ', regex=True)
+            .str.strip()
+        )
+        
+        return nombres.where(nombres.str.len() >= 2, None)
+    
     def limpiar_direccion(self, direccion: str) -> Optional[str]:
         """
         Limpia y normaliza direcciones
@@ -140,30 +252,43 @@ class LimpiadorTexto:
         direccion = str(direccion).strip()
         
         # Eliminar caracteres de control
-        direccion = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', direccion)
+        direccion = _RE_CARACTERES_CONTROL.sub('', direccion)
         
         # Normalizar espacios
-        direccion = re.sub(r'\s+', ' ', direccion)
+        direccion = RE_ESPACIOS.sub(' ', direccion)
         
         # Capitalizar apropiadamente
         direccion = direccion.title()
         
-        # Normalizar abreviaciones comunes
-        reemplazos = {
-            'C/': 'Calle ',
-            'Av.': 'Avenida ',
-            'Avda.': 'Avenida ',
-            'Pl.': 'Plaza ',
-            'Pza.': 'Plaza ',
-            'Nº': 'Número ',
-            'N°': 'Número '
-        }
-        
-        for abrev, completo in reemplazos.items():
-            direccion = direccion.replace(abrev, completo)
+        # Normalizar abreviaciones comunes (una sola pasada)
+        direccion = _RE_ABREVIATURAS.sub(
+            lambda m: _ABREVIATURAS_DIRECCION[m.group(0)], direccion
+        )
         
         return direccion if direccion else None
     
+    def limpiar_direcciones(self, direcciones: pd.Series) -> pd.Series:
+        """
+        Versión vectorizada de limpiar_direccion para una columna completa
+        
+        Args:
+            direcciones: Serie con direcciones
+            
+        Returns:
+            Serie con direcciones limpias (None si quedan vacías)
+        """
+        direcciones = _formato_titulo(
+            direcciones.str.strip()
+            .str.replace(_RE_CARACTERES_CONTROL, '', regex=True)
+            .str.replace(RE_ESPACIOS, ' ', regex=True)
+        ).str.replace(
+            _RE_ABREVIATURAS,
+            lambda m: _ABREVIATURAS_DIRECCION[m.group(0)],
+            regex=True
+        )
+        
+        return direcciones.where(direcciones.str.len() > 0, None)
+    
     def extraer_codigo_postal(self, texto: str) -> Optional[str]:
         """
         Extrae código postal de un texto
@@ -178,7 +303,7 @@ class LimpiadorTexto:
             return None
         
         # Buscar patrón de 5 dígitos
-        match = re.search(r'\b(\d{5})\b', str(texto))
+        match = _RE_CODIGO_POSTAL.search(str(texto))
         
         if match:
             return match.group(1)
@@ -222,23 +347,37 @@ class LimpiadorTexto:
             return ""
         
         # Eliminar etiquetas HTML
-        texto_limpio = re.sub(r'<[^>]+>', '', str(texto))
-        
-        # Decodificar entidades HTML comunes
-        entidades = {
-            '&amp;': '&',
-            '&lt;': '<',
-            '&gt;': '>',
-            '&quot;': '"',
-            '&#39;': "'",
-            '&nbsp;': ' '
-        }
+        texto_limpio = RE_ETIQUETA_HTML.sub('', str(texto))
         
-        for entidad, caracter in entidades.items():
-            texto_limpio = texto_limpio.replace(entidad, caracter)
+        # Decodificar entidades HTML (&nbsp; pasa a ser un espacio normal)
+        texto_limpio = html.unescape(texto_limpio).replace('\xa0', ' ')
         
         return texto_limpio.strip()
     
+    def limpiar_htmls(self, textos: pd.Series) -> pd.Series:
+        """
+        Versión vectorizada de limpiar_html para una columna completa
+        
+        Args:
+            textos: Serie con textos que pueden contener HTML
+            
+        Returns:
+            Serie con textos sin etiquetas HTML ('' si no son texto)
+        """
+        textos = (
+            textos.str.replace(RE_ETIQUETA_HTML, '', regex=True)
+            # Decodificar solo las entidades encontradas, en la misma pasada
+            .str.replace(
+                RE_ENTIDAD_HTML,
+                lambda m: html.unescape(m.group(0)),
+                regex=True
+            )
+            .str.replace('\xa0', ' ', regex=False)
+            .str.strip()
+        )
+        
+        return textos.fillna('')
+    
     def validar_dni(self, dni: str) -> bool:
         """
         Valida un DNI español
@@ -255,7 +394,7 @@ class LimpiadorTexto:
         dni = str(dni).strip().upper()
         
         # Verificar formato
-        if not re.match(self.patrones['dni'], dni):
+        if not self.regex['dni'].match(dni):
             return False
         
         # Verificar letra de control
@@ -264,6 +403,29 @@ class LimpiadorTexto:
         letra_calculada = letras[numero % 23]
         
         return dni[8] == letra_calculada
+    
+    def validar_dnis(self, dnis: pd.Series) -> pd.Series:
+        """
+        Versión vectorizada de validar_dni para una columna completa
+        
+        Args:
+            dnis: Serie con DNIs a validar
+            
+        Returns:
+            Serie booleana (True si el DNI es válido)
+        """
+        dnis = dnis.str.strip().str.upper()
+        formato_valido = dnis.str.match(self.regex['dni'], na=False).to_numpy(dtype=bool)
+        
+        # Letra de control, solo para los DNIs con formato correcto
+        letras = np.array(list('TRWAGMYFPDXBNJZSQVHLCKE'))
+        correctos = dnis[formato_valido]
+        numeros = correctos.str[:8].astype(np.int64).to_numpy()
+        
+        validos = np.zeros(len(dnis), dtype=bool)
+        validos[formato_valido] = correctos.str[8].to_numpy() == letras[numeros % 23]
+        
+        return pd.Series(validos, index=dnis.index, name=dnis.name)
 
 def crear_datos_sucios():
     """Crea un dataset con datos de texto sucios para demostración"""
@@ -321,11 +483,11 @@ def demostrar_limpieza_telefonos():
     df = crear_datos_sucios()
     
     # Limpiar teléfonos
-    df['telefono_limpio'] = df['telefono'].apply(limpiador.limpiar_telefono)
+    df['telefono_limpio'] = limpiador.limpiar_telefonos(df['telefono'])
     
     # Mostrar resultados
     print("Resultados de limpieza de teléfonos:")
-    print(df[['telefono', 'telefono_limpio']].to_string(index=False))
+    print(vista_previa(df[['telefono', 'telefono_limpio']]).to_string(index=False))
     
     # Estadísticas
     validos = df['telefono_limpio'].notna().sum()
@@ -343,11 +505,11 @@ def demostrar_limpieza_emails():
     df = crear_datos_sucios()
     
     # Limpiar emails
-    df['email_limpio'] = df['email'].apply(limpiador.limpiar_email)
+    df['email_limpio'] = limpiador.limpiar_emails(df['email'])
     
     # Mostrar resultados
     print("Resultados de limpieza de emails:")
-    print(df[['email', 'email_limpio']].to_string(index=False))
+    print(vista_previa(df[['email', 'email_limpio']]).to_string(index=False))
     
     # Estadísticas
     validos = df['email_limpio'].notna().sum()
@@ -365,11 +527,11 @@ def demostrar_limpieza_nombres():
     df = crear_datos_sucios()
     
     # Limpiar nombres
-    df['nombre_limpio'] = df['nombre'].apply(limpiador.limpiar_nombre)
+    df['nombre_limpio'] = limpiador.limpiar_nombres(df['nombre'])
     
     # Mostrar resultados
     print("Resultados de limpieza de nombres:")
-    print(df[['nombre', 'nombre_limpio']].to_string(index=False))
+    print(vista_previa(df[['nombre', 'nombre_limpio']]).to_string(index=False))
     
     return df
 
@@ -382,14 +544,15 @@ def demostrar_limpieza_html():
     df = crear_datos_sucios()
     
     # Limpiar HTML
-    df['descripcion_limpia'] = df['descripcion_html'].apply(limpiador.limpiar_html)
+    df['descripcion_limpia'] = limpiador.limpiar_htmls(df['descripcion_html'])
     
     # Mostrar resultados
     print("Resultados de limpieza de HTML:")
-    for i, row in df.iterrows():
-        print(f"\nOriginal: {row['descripcion_html']}")
-        print(f"Limpio:   {row['descripcion_limpia']}")
-        print("-" * 40)
+    bloques = [
+        f"\nOriginal: {original}\nLimpio:   {limpio}\n{'-' * 40}"
+        for original, limpio in zip(df['descripcion_html'], df['descripcion_limpia'])
+    ]
+    print("\n".join(bloques))
     
     return df
 
@@ -402,11 +565,11 @@ def demostrar_validacion_dni():
     df = crear_datos_sucios()
     
     # Validar DNIs
-    df['dni_valido'] = df['dni'].apply(limpiador.validar_dni)
+    df['dni_valido'] = limpiador.validar_dnis(df['dni'])
     
     # Mostrar resultados
     print("Resultados de validación de DNI:")
-    print(df[['dni', 'dni_valido']].to_string(index=False))
+    print(vista_previa(df[['dni', 'dni_valido']]).to_string(index=False))
     
     # Estadísticas
     validos = df['dni_valido'].sum()
@@ -427,22 +590,23 @@ def pipeline_limpieza_completo():
     print(df.head().to_string())
     
     # Aplicar todas las limpiezas
-    df['telefono_limpio'] = df['telefono'].apply(limpiador.limpiar_telefono)
-    df['email_limpio'] = df['email'].apply(limpiador.limpiar_email)
-    df['nombre_limpio'] = df['nombre'].apply(limpiador.limpiar_nombre)
-    df['direccion_limpia'] = df['direccion'].apply(limpiador.limpiar_direccion)
-    df['descripcion_limpia'] = df['descripcion_html'].apply(limpiador.limpiar_html)
-    df['dni_valido'] = df['dni'].apply(limpiador.validar_dni)
+    # Cada valor distinto se limpia una sola vez aunque se repita
+    df['telefono_limpio'] = limpiar_por_valores_unicos(df['telefono'], limpiador.limpiar_telefono)
+    df['email_limpio'] = limpiar_por_valores_unicos(df['email'], limpiador.limpiar_email)
+    df['nombre_limpio'] = limpiar_por_valores_unicos(df['nombre'], limpiador.limpiar_nombre)
+    df['direccion_limpia'] = limpiar_por_valores_unicos(df['direccion'], limpiador.limpiar_direccion)
+    df['descripcion_limpia'] = limpiar_por_valores_unicos(df['descripcion_html'], limpiador.limpiar_html)
+    df['dni_valido'] = limpiar_por_valores_unicos(df['dni'], limpiador.validar_dni)
     
     print("\nDatos limpios:")
-    columnas_limpias = [col for col in df.columns if 'limpio' in col or 'valido' in col]
+    columnas_limpias = ['telefono_limpio', 'email_limpio', 'nombre_limpio', 'dni_valido']
     print(df[columnas_limpias].head().to_string())
     
     # Resumen de calidad
     print("\n📊 RESUMEN DE CALIDAD DE DATOS:")
     print("=" * 40)
     
-    for col in ['telefono_limpio', 'email_limpio', 'nombre_limpio', 'dni_valido']:
+    for col in columnas_limpias:
         if col in df.columns:
             if 'valido' in col:
                 validos = df[col].sum()
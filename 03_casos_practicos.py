@@ -11,15 +11,50 @@ Este módulo presenta casos prácticos reales de limpieza de datos:
 import pandas as pd
 import numpy as np
 import re
+import html
 from datetime import datetime, timedelta
 import pytz
 from typing import Dict, List, Optional, Tuple
-import warnings
-warnings.filterwarnings('ignore')
+
+from utilidades import (
+    RE_ENTIDAD_HTML, RE_ESPACIOS, RE_ETIQUETA_HTML, RE_NUMERO,
+    a_cadenas_python, limpiar_por_valores_unicos, vista_previa
+)
+
+# Patrones de precios: número seguido de moneda, o solo número
+_RE_PRECIO_MONEDA = re.compile(
+    r'([\d,\.]+)\s*([€$£¥]|EUR|USD|GBP|JPY|euros?|dollars?|pounds?|yen)',
+    re.IGNORECASE
+)
+
+# Caracteres especiales no permitidos en descripciones
+_RE_CARACTERES_ESPECIALES = re.compile(r'[^\w\s.,!?()-]')
+
+# SKU: solo caracteres alfanuméricos y guiones
+_RE_SKU = re.compile(r'^[A-Z0-9-]+$')
 
 class LimpiadorEcommerce:
     """Clase especializada para limpiar datos de e-commerce"""
     
+    # Mapeo de categorías similares
+    MAPEO_CATEGORIAS = {
+        'electronics': ['electronic', 'electrónica', 'electrónicos', 'tech'],
+        'clothing': ['ropa', 'vestimenta', 'clothes', 'fashion'],
+        'books': ['libros', 'book', 'literatura'],
+        'home': ['hogar', 'casa', 'home & garden', 'decoración'],
+        'sports': ['deportes', 'sport', 'fitness', 'ejercicio'],
+        'beauty': ['belleza', 'cosmética', 'makeup', 'skincare'],
+        'toys': ['juguetes', 'toy', 'juegos', 'games'],
+        'automotive': ['automóvil', 'auto', 'car', 'vehículos']
+    }
+    
+    # Una alternativa compilada por categoría: un solo escaneo del texto
+    # por categoría en lugar de una búsqueda por cada variante
+    PATRONES_CATEGORIAS = [
+        (categoria.upper(), re.compile('|'.join(map(re.escape, variantes))))
+        for categoria, variantes in MAPEO_CATEGORIAS.items()
+    ]
+    
     def __init__(self):
         self.monedas = {
             '€': 'EUR', 'EUR': 'EUR', 'euros': 'EUR',
@@ -48,16 +83,15 @@ class LimpiadorEcommerce:
         if pd.isna(precio_str) or not isinstance(precio_str, str):
             return None
         
-        # Extraer número y moneda
-        precio_str = str(precio_str).strip()
+        # Extraer número y moneda (ya se comprobó que es str)
+        precio_str = precio_str.strip()
         
         # Buscar patrón de precio con moneda
-        patron_precio = r'([\d,\.]+)\s*([€$£¥]|EUR|USD|GBP|JPY|euros?|dollars?|pounds?|yen)'
-        match = re.search(patron_precio, precio_str, re.IGNORECASE)
+        match = _RE_PRECIO_MONEDA.search(precio_str)
         
         if not match:
             # Intentar solo número
-            numeros = re.findall(r'[\d,\.]+', precio_str)
+            numeros = RE_NUMERO.findall(precio_str)
             if numeros:
                 try:
                     precio_num = self._parsear_numero(numeros[0])
@@ -78,6 +112,34 @@ class LimpiadorEcommerce:
         
         return precio_num
     
+    def normalizar_precios(self, precios: pd.Series) -> pd.Series:
+        """
+        Versión vectorizada de normalizar_precio para una columna completa
+        
+        Args:
+            precios: Serie con precios y monedas
+            
+        Returns:
+            Serie con precios normalizados en USD (NaN si no son válidos)
+        """
+        # Una sola pasada de regex sobre toda la columna: (número, moneda)
+        extraido = precios.str.extract(_RE_PRECIO_MONEDA)
+        
+        # Sin moneda reconocida: primer número encontrado, asumiendo USD
+        numeros = extraido[0].fillna(precios.str.extract(RE_NUMERO, expand=False))
+        precios_num = self._parsear_numeros(numeros)
+        
+        # Tasa de cada moneda distinta (pocas) y reparto a las filas por
+        # código de categoría; el código -1 (sin moneda) cae en la última
+        # posición, USD
+        monedas = extraido[1].str.upper().astype('category')
+        tasas = np.array(
+            [self.tasas_cambio.get(self.monedas.get(moneda, 'USD'), 1.0)
+             for moneda in monedas.cat.categories]
+            + [self.tasas_cambio['USD']]
+        )
+        return precios_num / tasas[monedas.cat.codes.to_numpy()]
+    
     def _parsear_numero(self, numero_str: str) -> float:
         """
         Parsea números en formato europeo o americano
@@ -112,6 +174,39 @@ class LimpiadorEcommerce:
         
         return float(numero_str)
     
+    def _parsear_numeros(self, numeros: pd.Series) -> pd.Series:
+        """
+        Versión vectorizada de _parsear_numero
+        
+        Args:
+            numeros: Serie de strings con números
+            
+        Returns:
+            Serie de floats (NaN si no se pueden convertir)
+        """
+        tiene_coma = numeros.str.contains(',', regex=False, na=False)
+        tiene_punto = numeros.str.contains('.', regex=False, na=False)
+        posicion_coma = numeros.str.rfind(',')
+        
+        # Formato europeo con ambos separadores: 1.099,00
+        europeo = tiene_coma & tiene_punto & (posicion_coma > numeros.str.rfind('.'))
+        # Solo una coma con 1-2 decimales: 1099,00
+        coma_decimal = (
+            tiene_coma & ~tiene_punto
+            & (numeros.str.count(',') == 1)
+            & (numeros.str.len() - posicion_coma <= 3)
+        )
+        
+        # Por defecto formato americano: las comas son separadores de miles
+        normalizados = numeros.str.replace(',', '', regex=False)
+        normalizados = normalizados.mask(
+            europeo,
+            numeros.str.replace('.', '', regex=False).str.replace(',', '.', regex=False)
+        )
+        normalizados = normalizados.mask(coma_decimal, numeros.str.replace(',', '.', regex=False))
+        
+        return pd.to_numeric(normalizados, errors='coerce')
+    
     def limpiar_categoria(self, categoria: str) -> str:
         """
         Normaliza categorías de productos
@@ -127,25 +222,26 @@ class LimpiadorEcommerce:
         
         categoria = str(categoria).strip().lower()
         
-        # Mapeo de categorías similares
-        mapeo_categorias = {
-            'electronics': ['electronic', 'electrónica', 'electrónicos', 'tech'],
-            'clothing': ['ropa', 'vestimenta', 'clothes', 'fashion'],
-            'books': ['libros', 'book', 'literatura'],
-            'home': ['hogar', 'casa', 'home & garden', 'decoración'],
-            'sports': ['deportes', 'sport', 'fitness', 'ejercicio'],
-            'beauty': ['belleza', 'cosmética', 'makeup', 'skincare'],
-            'toys': ['juguetes', 'toy', 'juegos', 'games'],
-            'automotive': ['automóvil', 'auto', 'car', 'vehículos']
-        }
-        
-        # Buscar categoría más similar
-        for categoria_estandar, variantes in mapeo_categorias.items():
-            if any(var in categoria for var in variantes):
-                return categoria_estandar.upper()
+        # Buscar categoría más similar (la primera del mapeo que coincida)
+        for categoria_estandar, patron in self.PATRONES_CATEGORIAS:
+            if patron.search(categoria):
+                return categoria_estandar
         
         return categoria.upper()
     
+    def limpiar_categorias(self, categorias: pd.Series) -> pd.Series:
+        """
+        Versión vectorizada de limpiar_categoria para una columna completa
+        
+        Args:
+            categorias: Serie con categorías originales
+            
+        Returns:
+            Serie con categorías normalizadas
+        """
+        # Hay pocas categorías distintas: cada una se limpia una sola vez
+        return limpiar_por_valores_unicos(categorias, self.limpiar_categoria)
+    
     def limpiar_descripcion(self, descripcion: str) -> str:
         """
         Limpia descripciones de productos con HTML y caracteres especiales
@@ -160,25 +256,45 @@ class LimpiadorEcommerce:
             return ''
         
         # Eliminar HTML
-        descripcion = re.sub(r'<[^>]+>', '', str(descripcion))
-        
-        # Decodificar entidades HTML
-        entidades = {
-            '&amp;': '&', '&lt;': '<', '&gt;': '>',
-            '&quot;': '"', '&#39;': "'", '&nbsp;': ' '
-        }
+        descripcion = RE_ETIQUETA_HTML.sub('', str(descripcion))
         
-        for entidad, caracter in entidades.items():
-            descripcion = descripcion.replace(entidad, caracter)
+        # Decodificar entidades HTML (&nbsp; pasa a ser un espacio normal)
+        descripcion = html.unescape(descripcion).replace('\xa0', ' ')
         
         # Limpiar caracteres especiales excesivos
-        descripcion = re.sub(r'[^\w\s.,!?()-]', '', descripcion)
+        descripcion = _RE_CARACTERES_ESPECIALES.sub('', descripcion)
         
         # Normalizar espacios
-        descripcion = re.sub(r'\s+', ' ', descripcion).strip()
+        descripcion = RE_ESPACIOS.sub(' ', descripcion).strip()
         
         return descripcion
     
+    def limpiar_descripciones(self, descripciones: pd.Series) -> pd.Series:
+        """
+        Versión vectorizada de limpiar_descripcion para una columna completa
+        
+        Args:
+            descripciones: Serie con descripciones originales
+            
+        Returns:
+            Serie con descripciones limpias ('' si no son texto)
+        """
+        descripciones = (
+            descripciones.str.replace(RE_ETIQUETA_HTML, '', regex=True)
+            # Decodificar solo las entidades encontradas, en la misma pasada
+            .str.replace(
+                RE_ENTIDAD_HTML,
+                lambda m: html.unescape(m.group(0)),
+                regex=True
+            )
+            .str.replace('\xa0', ' ', regex=False)
+            .str.replace(_RE_CARACTERES_ESPECIALES, '', regex=True)
+            .str.replace(RE_ESPACIOS, ' ', regex=True)
+            .str.strip()
+        )
+        
+        return descripciones.fillna('')
+    
     def validar_sku(self, sku: str) -> bool:
         """
         Valida formato de SKU (Stock Keeping Unit)
@@ -199,14 +315,44 @@ class LimpiadorEcommerce:
             return False
         
         # Solo caracteres alfanuméricos y guiones
-        if not re.match(r'^[A-Z0-9-]+$', sku.upper()):
+        if not _RE_SKU.match(sku.upper()):
             return False
         
         return True
+    
+    def validar_skus(self, skus: pd.Series) -> pd.Series:
+        """
+        Versión vectorizada de validar_sku para una columna completa
+        
+        Args:
+            skus: Serie con SKUs a validar
+            
+        Returns:
+            Serie booleana (True si el SKU es válido)
+        """
+        # upper con la semántica de Python, como validar_sku ("ß" -> "SS")
+        skus = a_cadenas_python(skus).str.strip()
+        validos = skus.str.len().ge(3) & skus.str.upper().str.match(_RE_SKU, na=False)
+        
+        # Los valores que no son texto quedan como nulos: no son válidos
+        return validos.fillna(False).astype(bool)
 
 class LimpiadorTemporal:
     """Clase especializada para limpiar datos temporales"""
     
+    # Formatos comunes agrupados por (separador, lleva hora)
+    FORMATOS_FECHA = {
+        ('-', True): ('%Y-%m-%d %H:%M:%S', '%d-%m-%Y %H:%M:%S'),
+        ('-', False): ('%Y-%m-%d', '%d-%m-%Y'),
+        ('/', True): ('%d/%m/%Y %H:%M:%S', '%m/%d/%Y %H:%M:%S'),
+        ('/', False): ('%d/%m/%Y', '%m/%d/%Y'),
+        ('T', True): ('%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%SZ', '%Y-%m-%dT%H:%M:%S.%fZ'),
+        ('T', False): ()
+    }
+    
+    # Formato más habitual: parsear_fechas lo prueba primero sobre toda la columna
+    FORMATO_HABITUAL = '%Y-%m-%d %H:%M:%S'
+    
     def __init__(self):
         self.zonas_horarias = {
             'ES': 'Europe/Madrid',
@@ -231,20 +377,15 @@ class LimpiadorTemporal:
         
         fecha_str = str(fecha_str).strip()
         
-        # Formatos comunes
-        formatos = [
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d',
-            '%d/%m/%Y %H:%M:%S',
-            '%d/%m/%Y',
-            '%d-%m-%Y %H:%M:%S',
-            '%d-%m-%Y',
-            '%m/%d/%Y %H:%M:%S',
-            '%m/%d/%Y',
-            '%Y-%m-%dT%H:%M:%S',
-            '%Y-%m-%dT%H:%M:%SZ',
-            '%Y-%m-%dT%H:%M:%S.%fZ'
-        ]
+        # Elegir solo los formatos compatibles según el separador de la fecha
+        # ('T' ISO, '/' o '-') y si lleva hora (':'), en el orden original
+        if 'T' in fecha_str.upper():
+            familia = 'T'
+        elif '/' in fecha_str:
+            familia = '/'
+        else:
+            familia = '-'
+        formatos = self.FORMATOS_FECHA[(familia, ':' in fecha_str)]
         
         for formato in formatos:
             try:
@@ -254,6 +395,66 @@ class LimpiadorTemporal:
         
         return None
     
+    def parsear_fechas(self, fechas: pd.Series) -> pd.Series:
+        """
+        Versión vectorizada de parsear_fecha_flexible para una columna completa
+        
+        Args:
+            fechas: Serie con fechas en diferentes formatos
+            
+        Returns:
+            Serie datetime64 (NaT si no se puede parsear)
+        """
+        fechas = fechas.str.strip()
+        resultado = pd.Series(pd.NaT, index=fechas.index, dtype='datetime64[ns]')
+        
+        # Vía rápida: el formato más habitual (ISO con hora) sobre toda la
+        # columna; si lo cumplen todas las filas no hace falta clasificarlas
+        parseadas = pd.to_datetime(fechas, format=self.FORMATO_HABITUAL, errors='coerce')
+        resultado = resultado.fillna(parseadas)
+        pendientes = resultado.isna() & fechas.notna()
+        if not pendientes.any():
+            return resultado
+        
+        # Clasificar todas las filas con la misma regla que
+        # parsear_fecha_flexible: separador ('T' ISO, '/' o '-') y hora (':')
+        es_iso = fechas.str.contains('T', case=False, regex=False, na=False)
+        con_barra = fechas.str.contains('/', regex=False, na=False) & ~es_iso
+        familias = {
+            'T': es_iso,
+            '/': con_barra,
+            '-': fechas.notna() & ~es_iso & ~con_barra
+        }
+        con_hora = fechas.str.contains(':', regex=False, na=False)
+        
+        # Cada grupo solo prueba sus formatos compatibles (salvo el habitual,
+        # ya probado), y cada formato solo las filas que siguen sin parsear
+        for (familia, lleva_hora), formatos in self.FORMATOS_FECHA.items():
+            grupo = familias[familia] & (con_hora == lleva_hora)
+            for formato in formatos:
+                if formato == self.FORMATO_HABITUAL:
+                    continue
+                
+                pendientes = grupo & resultado.isna()
+                if not pendientes.any():
+                    break
+                
+                parseadas = pd.to_datetime(
+                    fechas[pendientes], format=formato, errors='coerce'
+                )
+                resultado = resultado.fillna(parseadas)
+        
+        # Las pocas filas que quedan en NaT (p. ej. 't'/'z' en minúscula, que
+        # strptime acepta) pasan por la versión fila a fila
+        pendientes = resultado.isna() & fechas.notna()
+        if pendientes.any():
+            rescatadas = pd.to_datetime(
+                fechas[pendientes].map(self.parsear_fecha_flexible), errors='coerce'
+            )
+            resultado = resultado.fillna(rescatadas)
+        
+        return resultado
+    
     def normalizar_zona_horaria(self, fecha: datetime, zona_original: str = 'UTC') -> datetime:
         """
         Normaliza zona horaria de una fecha
@@ -324,7 +525,7 @@ class LimpiadorTemporal:
         Args:
             df: DataFrame con datos temporales
             columna_fecha: Nombre de la columna de fecha
-            frecuencia: Frecuencia deseada ('D'=diaria, 'H'=horaria, etc.)
+            frecuencia: Frecuencia deseada ('D'=diaria, 'h'=horaria, etc.)
             
         Returns:
             DataFrame con gaps rellenados
@@ -444,17 +645,17 @@ def caso_ecommerce():
     limpiador = LimpiadorEcommerce()
     
     print("Datos originales:")
-    print(df.to_string(index=False))
+    print(vista_previa(df).to_string(index=False))
     
     # Aplicar limpiezas
-    df['precio_normalizado'] = df['precio'].apply(limpiador.normalizar_precio)
-    df['categoria_limpia'] = df['categoria'].apply(limpiador.limpiar_categoria)
-    df['descripcion_limpia'] = df['descripcion'].apply(limpiador.limpiar_descripcion)
-    df['sku_valido'] = df['sku'].apply(limpiador.validar_sku)
+    df['precio_normalizado'] = limpiador.normalizar_precios(df['precio'])
+    df['categoria_limpia'] = limpiador.limpiar_categorias(df['categoria'])
+    df['descripcion_limpia'] = limpiador.limpiar_descripciones(df['descripcion'])
+    df['sku_valido'] = limpiador.validar_skus(df['sku'])
     
     print("\nDatos limpios:")
     columnas_limpias = ['producto_id', 'precio_normalizado', 'categoria_limpia', 'sku_valido']
-    print(df[columnas_limpias].to_string(index=False))
+    print(vista_previa(df[columnas_limpias]).to_string(index=False))
     
     # Análisis de calidad
     print("\n📊 ANÁLISIS DE CALIDAD:")
@@ -483,14 +684,16 @@ def caso_temporal():
     print(df.head().to_string(index=False))
     
     # Parsear fechas
-    df['timestamp_parsed'] = df['timestamp'].apply(limpiador.parsear_fecha_flexible)
-    
-    # Normalizar zona horaria
-    df['timestamp_utc'] = df.apply(
-        lambda row: limpiador.normalizar_zona_horaria(
-            row['timestamp_parsed'], 
-            row['zona_horaria']
-        ), axis=1
+    df['timestamp_parsed'] = limpiador.parsear_fechas(df['timestamp'])
+    
+    # Normalizar zona horaria (recorrer las dos columnas juntas evita
+    # construir una Serie por fila como hace apply(axis=1))
+    df['timestamp_utc'] = pd.Series(
+        [
+            limpiador.normalizar_zona_horaria(fecha, zona)
+            for fecha, zona in zip(df['timestamp_parsed'], df['zona_horaria'])
+        ],
+        index=df.index
     )
     
     # Detectar frecuencia
@@ -503,7 +706,7 @@ def caso_temporal():
     df_limpio = limpiador.rellenar_gaps_temporales(
         df.dropna(subset=['timestamp_utc']), 
         'timestamp_utc', 
-        '2H'  # Cada 2 horas
+        '2h'  # Cada 2 horas
     )
     
     print(f"\nDatos con gaps rellenados:")
@@ -16,7 +16,25 @@ from typing import Dict, List, Optional, Any, Callable
 from datetime import datetime
 import json
 import warnings
-warnings.filterwarnings('ignore')
+
+from utilidades import RE_EMAIL, RE_ESPACIOS, RE_TELEFONO_ESPANA, dataset_cacheado
+
+def resumen_calidad(df: pd.DataFrame) -> Dict[str, int]:
+    """
+    Resume el tamaño, los nulos y los duplicados de un DataFrame
+    
+    Args:
+        df: DataFrame a resumir
+        
+    Returns:
+        Diccionario con filas, columnas, nulos_totales y duplicados
+    """
+    return {
+        'filas': len(df),
+        'columnas': len(df.columns),
+        'nulos_totales': int(df.isna().to_numpy().sum()),
+        'duplicados': int(df.duplicated().sum())
+    }
 
 class DataCleaner:
     """
@@ -112,27 +130,28 @@ class DataCleaner:
         if not self.config['manejar_nulos']:
             return df
         
-        df_limpio = df.copy()
-        nulos_por_columna = df.isnull().sum()
-        
-        for columna in df.columns:
-            if nulos_por_columna[columna] > 0:
-                if df[columna].dtype in ['int64', 'float64']:
-                    # Columnas numéricas
-                    if self.config['metodo_imputacion'] == 'mean':
-                        valor_imputacion = df[columna].mean()
-                    elif self.config['metodo_imputacion'] == 'median':
-                        valor_imputacion = df[columna].median()
-                    elif self.config['metodo_imputacion'] == 'forward_fill':
-                        df_limpio[columna] = df[columna].fillna(method='ffill')
-                        continue
-                    else:
-                        valor_imputacion = df[columna].median()
-                    
-                    df_limpio[columna] = df[columna].fillna(valor_imputacion)
-                else:
-                    # Columnas de texto
-                    df_limpio[columna] = df[columna].fillna('UNKNOWN')
+        nulos_por_columna = df.isna().sum()
+        columnas_con_nulos = nulos_por_columna.index[nulos_por_columna > 0]
+        numericas = [col for col in columnas_con_nulos if pd.api.types.is_numeric_dtype(df[col])]
+        
+        # Columnas de texto: valor fijo
+        valores_imputacion = {
+            col: 'UNKNOWN' for col in columnas_con_nulos if col not in numericas
+        }
+        
+        # Columnas numéricas: estadístico de todas las columnas en una sola
+        # llamada (forward_fill se aplica aparte, no es un valor fijo)
+        metodo = self.config['metodo_imputacion']
+        if numericas and metodo != 'forward_fill':
+            if metodo == 'mean':
+                valores_imputacion.update(df[numericas].mean().to_dict())
+            else:
+                valores_imputacion.update(df[numericas].median().to_dict())
+        
+        # Un único fillna con un valor por columna (fillna ya devuelve copia)
+        df_limpio = df.fillna(valores_imputacion)
+        if numericas and metodo == 'forward_fill':
+            df_limpio[numericas] = df[numericas].ffill()
         
         self._registrar_transformacion(
             'manejar_valores_nulos',
@@ -158,7 +177,7 @@ class DataCleaner:
             
             if self.config['texto_espacios']:
                 df_limpio[columna] = df_limpio[columna].str.strip()
-                df_limpio[columna] = df_limpio[columna].str.replace(r'\s+', ' ', regex=True)
+                df_limpio[columna] = df_limpio[columna].str.replace(RE_ESPACIOS, ' ', regex=True)
         
         self._registrar_transformacion(
             'estandarizar_texto',
@@ -176,18 +195,24 @@ class DataCleaner:
         if not self.config['detectar_outliers']:
             return df
         
-        df_limpio = df.copy()
         columnas_numericas = df.select_dtypes(include=[np.number]).columns
-        outliers_detectados = {}
         
-        for columna in columnas_numericas:
-            # Método Z-score
-            z_scores = np.abs((df[columna] - df[columna].mean()) / df[columna].std())
-            outliers = z_scores > self.config['umbral_outliers']
-            outliers_detectados[columna] = outliers.sum()
-            
-            # Marcar outliers
-            df_limpio[f'{columna}_outlier'] = outliers
+        # Método Z-score para todas las columnas a la vez sobre un bloque
+        # NumPy (ddof=1 e ignorando NaN, como Series.mean/std)
+        valores = df[columnas_numericas].to_numpy(dtype=float)
+        with warnings.catch_warnings(), np.errstate(divide='ignore', invalid='ignore'):
+            warnings.simplefilter('ignore', RuntimeWarning)
+            media = np.nanmean(valores, axis=0)
+            desviacion = np.nanstd(valores, axis=0, ddof=1)
+            outliers = np.abs((valores - media) / desviacion) > self.config['umbral_outliers']
+        
+        outliers_detectados = dict(zip(columnas_numericas, outliers.sum(axis=0)))
+        
+        # Marcar outliers (assign devuelve una copia de df)
+        df_limpio = df.assign(**{
+            f'{columna}_outlier': outliers[:, i]
+            for i, columna in enumerate(columnas_numericas)
+        })
         
         self._registrar_transformacion(
             'detectar_outliers',
@@ -205,21 +230,19 @@ class DataCleaner:
         if not self.config['validar_formatos']:
             return df
         
-        df_limpio = df.copy()
+        # Solo se cuentan valores válidos: no hace falta copiar el DataFrame
         validaciones = {}
         
         # Validar emails
         columnas_email = [col for col in df.columns if 'email' in col.lower()]
         for columna in columnas_email:
-            patron_email = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            emails_validos = df[columna].astype(str).str.match(patron_email, na=False)
+            emails_validos = df[columna].astype(str).str.match(RE_EMAIL, na=False)
             validaciones[f'{columna}_emails_validos'] = emails_validos.sum()
         
         # Validar teléfonos (formato español)
         columnas_telefono = [col for col in df.columns if 'telefono' in col.lower() or 'phone' in col.lower()]
         for columna in columnas_telefono:
-            patron_telefono = r'^(\+34|0034|34)?[6-9]\d{8}$'
-            telefonos_validos = df[columna].astype(str).str.match(patron_telefono, na=False)
+            telefonos_validos = df[columna].astype(str).str.match(RE_TELEFONO_ESPANA, na=False)
             validaciones[f'{columna}_telefonos_validos'] = telefonos_validos.sum()
         
         self._registrar_transformacion(
@@ -229,7 +252,7 @@ class DataCleaner:
             }
         )
         
-        return df_limpio
+        return df
     
     def fit_transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -243,30 +266,42 @@ class DataCleaner:
         """
         self.logger.info(f"Iniciando limpieza de datos - {len(df)} filas, {len(df.columns)} columnas")
         
+        # Cada ejecución registra solo sus propias transformaciones y
+        # estadísticas, así la misma instancia puede reutilizarse con varios
+        # DataFrames sin alterar los reportes anteriores
+        self.transformaciones = []
+        self.estadisticas = {}
+        
         # Guardar estadísticas iniciales
         self.estadisticas['inicial'] = {
             'filas': len(df),
             'columnas': len(df.columns),
-            'nulos_totales': df.isnull().sum().sum(),
-            'duplicados': df.duplicated().sum()
+            'nulos_totales': int(df.isna().to_numpy().sum())
         }
         
-        df_limpio = df.copy()
+        # Aplicar transformaciones en orden (ningún paso modifica su entrada,
+        # así que no hace falta una copia inicial completa)
+        df_limpio = self.eliminar_duplicados(df)
+        
+        # Si se eliminaron duplicados, las filas perdidas son justo los
+        # duplicados iniciales y no hace falta volver a hashear el DataFrame
+        if self.config['eliminar_duplicados']:
+            duplicados_iniciales = len(df) - len(df_limpio)
+        else:
+            duplicados_iniciales = int(df.duplicated().sum())
+        self.estadisticas['inicial']['duplicados'] = duplicados_iniciales
         
-        # Aplicar transformaciones en orden
-        df_limpio = self.eliminar_duplicados(df_limpio)
         df_limpio = self.manejar_valores_nulos(df_limpio)
         df_limpio = self.estandarizar_texto(df_limpio)
         df_limpio = self.detectar_outliers(df_limpio)
         df_limpio = self.validar_formatos(df_limpio)
         
+        # Si todos los pasos están desactivados, no devolver el mismo objeto
+        if df_limpio is df:
+            df_limpio = df.copy()
+        
         # Guardar estadísticas finales
-        self.estadisticas['final'] = {
-            'filas': len(df_limpio),
-            'columnas': len(df_limpio.columns),
-            'nulos_totales': df_limpio.isnull().sum().sum(),
-            'duplicados': df_limpio.duplicated().sum()
-        }
+        self.estadisticas['final'] = resumen_calidad(df_limpio)
         
         self.logger.info("Limpieza de datos completada")
         return df_limpio
@@ -337,25 +372,34 @@ class ValidadorCalidad:
         
         return resultados
 
+@dataset_cacheado
 def crear_datos_demo():
     """Crea datos de demostración para el pipeline"""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
+    
+    # Edad y salario en una sola llamada al generador
+    edad, salario = rng.normal([35, 50000], [10, 15000], size=(100, 2)).T
     
     datos = {
         'id': range(1, 101),
         'nombre': [f'Usuario_{i}' for i in range(1, 101)],
         'email': [f'usuario{i}@email.com' for i in range(1, 101)],
         'telefono': [f'+34-666-{i:03d}-{i+100:03d}' for i in range(1, 101)],
-        'edad': np.random.normal(35, 10, 100),
-        'salario': np.random.normal(50000, 15000, 100),
+        'edad': edad,
+        'salario': salario,
         'fecha_registro': pd.date_range('2023-01-01', periods=100, freq='D')
     }
     
     df = pd.DataFrame(datos)
     
+    # Reducir los tipos numéricos: float32 para edad/salario y el entero
+    # más pequeño que admita el id
+    df = df.astype({'edad': np.float32, 'salario': np.float32})
+    df['id'] = pd.to_numeric(df['id'], downcast='integer')
+    
     # Introducir problemas intencionalmente
-    # Duplicados
-    df = pd.concat([df, df.iloc[:5]], ignore_index=True)
+    # Duplicados: repetir las 5 primeras filas al final con un solo take
+    df = df.take(np.r_[0:len(df), 0:5]).reset_index(drop=True)
     
     # Valores nulos
     df.loc[10:15, 'email'] = None
@@ -376,11 +420,13 @@ def demostrar_pipeline():
     print("🚀 DEMOSTRACIÓN: PIPELINE AUTOMATIZADO DE DATA CLEANING")
     print("=" * 70)
     
-    # Crear datos de demostración
+    # Crear datos de demostración y describirlos antes de limpiarlos
     df_original = crear_datos_demo()
-    print(f"Datos originales: {len(df_original)} filas, {len(df_original.columns)} columnas")
-    print(f"Valores nulos: {df_original.isnull().sum().sum()}")
-    print(f"Duplicados: {df_original.duplicated().sum()}")
+    inicial = resumen_calidad(df_original)
+    
+    print(f"Datos originales: {inicial['filas']} filas, {inicial['columnas']} columnas")
+    print(f"Valores nulos: {inicial['nulos_totales']}")
+    print(f"Duplicados: {inicial['duplicados']}")
     
     # Configurar pipeline
     config = {
@@ -399,9 +445,12 @@ def demostrar_pipeline():
     # Aplicar limpieza
     df_limpio = limpiador.fit_transform(df_original)
     
-    print(f"\nDatos limpios: {len(df_limpio)} filas, {len(df_limpio.columns)} columnas")
-    print(f"Valores nulos: {df_limpio.isnull().sum().sum()}")
-    print(f"Duplicados: {df_limpio.duplicated().sum()}")
+    # Los conteos finales ya se calcularon dentro de fit_transform
+    final = limpiador.estadisticas['final']
+    
+    print(f"\nDatos limpios: {final['filas']} filas, {final['columnas']} columnas")
+    print(f"Valores nulos: {final['nulos_totales']}")
+    print(f"Duplicados: {final['duplicados']}")
     
     # Generar reporte
     reporte = limpiador.generar_reporte()
@@ -425,13 +474,13 @@ def demostrar_pipeline():
     
     validador.agregar_regla(
         'sin_nulos',
-        lambda df: df.isnull().sum().sum() == 0,
+        lambda df: not df.isna().to_numpy().any(),
         'No debe haber valores nulos'
     )
     
     validador.agregar_regla(
         'emails_validos',
-        lambda df: df['email'].str.contains('@').all(),
+        lambda df: df['email'].str.contains('@', regex=False).all(),
         'Todos los emails deben ser válidos'
     )
     
@@ -9,10 +9,7 @@ Incluye todos los ejemplos y casos prácticos integrados
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
 from datetime import datetime
-import warnings
-warnings.filterwarnings('ignore')
 
 # Importar módulos de la píldora
 from deteccion_outliers import (
@@ -290,7 +287,7 @@ def ejecutar_demo_rapida():
     print("Limpiando texto...")
     limpiador = LimpiadorTexto()
     df_texto = crear_datos_sucios()
-    df_texto['telefono_limpio'] = df_texto['telefono'].apply(limpiador.limpiar_telefono)
+    df_texto['telefono_limpio'] = limpiador.limpiar_telefonos(df_texto['telefono'])
     print(f"Teléfonos válidos: {df_texto['telefono_limpio'].notna().sum()}")
     
     # Pipeline automatizado
@@ -14,8 +14,6 @@ import json
 
 def crear_dataset_ecommerce():
     """Crea dataset de e-commerce con problemas típicos"""
-    np.random.seed(42)
-    
     # Productos base
     productos_base = [
         "iPhone 13 Pro Max 256GB",
@@ -81,8 +79,6 @@ def crear_dataset_ecommerce():
 
 def crear_dataset_clientes():
     """Crea dataset de clientes con datos sucios típicos"""
-    np.random.seed(42)
-    
     # Nombres con problemas
     nombres_sucios = [
         '  Juan Pérez  ', 'ANA GARCÍA', 'pedro lópez', 'MARÍA DEL CARMEN',
@@ -139,7 +135,7 @@ def crear_dataset_clientes():
 
 def crear_dataset_temporal():
     """Crea dataset temporal con problemas típicos"""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     # Crear fechas base con gaps intencionales
     fechas_base = []
@@ -168,15 +164,17 @@ def crear_dataset_temporal():
     humedad_base = 65
     presion_base = 1013
     
+    # Ruido de temperatura, humedad y presión en una sola llamada
+    ruido = rng.normal(0, [2, 3, 0.5], size=(len(fechas_mixtas), 3))
+    
     for i, fecha_str in enumerate(fechas_mixtas):
-        # Simular tendencia diaria
-        hora = datetime.strptime(fecha_str.split()[1], '%H:%M:%S').hour
+        # Simular tendencia diaria (la hora se toma de la fecha original: no
+        # hace falta volver a parsear el texto ya formateado)
+        hora = fechas_base[i].hour
         factor_diario = np.sin((hora - 6) * np.pi / 12) if 6 <= hora <= 18 else 0
         
         # Simular ruido
-        ruido_temp = np.random.normal(0, 2)
-        ruido_hum = np.random.normal(0, 3)
-        ruido_pres = np.random.normal(0, 0.5)
+        ruido_temp, ruido_hum, ruido_pres = ruido[i]
         
         datos.append({
             'timestamp': fecha_str,
@@ -191,16 +189,16 @@ def crear_dataset_temporal():
 
 def crear_dataset_outliers():
     """Crea dataset con outliers para demostración"""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     # Datos normales
     n_normal = 200
     datos_normales = {
-        'precio': np.random.normal(50, 15, n_normal),
-        'cantidad': np.random.poisson(5, n_normal),
-        'descuento': np.random.beta(2, 5, n_normal),
-        'edad_cliente': np.random.normal(35, 10, n_normal),
-        'satisfaccion': np.random.normal(4.0, 0.8, n_normal)
+        'precio': rng.normal(50, 15, n_normal),
+        'cantidad': rng.poisson(5, n_normal),
+        'descuento': rng.beta(2, 5, n_normal),
+        'edad_cliente': rng.normal(35, 10, n_normal),
+        'satisfaccion': rng.normal(4.0, 0.8, n_normal)
     }
     
     # Agregar outliers intencionalmente
@@ -212,15 +210,17 @@ def crear_dataset_outliers():
         'satisfaccion': [1.0, 1.5, 5.0, 0.5, 1.2, 4.9]
     }
     
-    # Combinar datos
-    df_normales = pd.DataFrame(datos_normales)
-    df_outliers = pd.DataFrame(outliers)
-    
-    df_completo = pd.concat([df_normales, df_outliers], ignore_index=True)
-    df_completo['id'] = range(len(df_completo))
-    df_completo['tipo'] = ['normal'] * n_normal + ['outlier'] * len(outliers['precio'])
+    # Unir cada columna en un solo array y construir el DataFrame una vez
+    # (sin DataFrames intermedios ni concat)
+    columnas = {
+        col: np.concatenate([valores, outliers[col]])
+        for col, valores in datos_normales.items()
+    }
+    n_outliers = len(outliers['precio'])
+    columnas['id'] = np.arange(n_normal + n_outliers)
+    columnas['tipo'] = ['normal'] * n_normal + ['outlier'] * n_outliers
     
-    return df_completo
+    return pd.DataFrame(columnas)
 
 def guardar_datasets():
     """Guarda todos los datasets en archivos CSV"""
@@ -10,19 +10,277 @@ Incluye menú de navegación, ejemplos en vivo y visualizaciones.
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from datetime import datetime
 import warnings
 import os
 import sys
+import json
+import tempfile
 import importlib.util
-warnings.filterwarnings('ignore')
+from concurrent.futures import ThreadPoolExecutor
 
-# Configurar visualizaciones
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
-plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['font.size'] = 10
+from utilidades import RE_NUMERO, preparar_estilo_graficos
+
+# Sin pantalla (Linux sin DISPLAY ni WAYLAND_DISPLAY) no hay ventanas que
+# abrir: usar el backend Agg y limitarse a guardar los PNG
+if (sys.platform.startswith('linux') and not os.environ.get('DISPLAY')
+        and not os.environ.get('WAYLAND_DISPLAY')):
+    plt.switch_backend('Agg')
+
+# Las consolas de Windows solo interpretan secuencias ANSI (usadas para
+# limpiar la pantalla) tras activarlas; os.system('') lo hace una vez
+if os.name == 'nt':
+    os.system('')
+
+# El estilo de las visualizaciones (seaborn) se aplica al crear la primera
+# figura, ver utilidades.preparar_estilo_graficos
+
+# Agg dibuja los trazos largos por bloques de vértices
+plt.rcParams['agg.path.chunksize'] = 10000
+
+# Opciones de guardado de las visualizaciones: 120 dpi basta para pantalla
+# y una compresión PNG baja codifica mucho más rápido (ficheros algo mayores)
+SAVEFIG_KW = dict(
+    dpi=120,
+    bbox_inches='tight',
+    pil_kwargs={'compress_level': 1, 'optimize': False}
+)
+
+# pyarrow es opcional: si está instalado, las columnas de texto se guardan
+# como cadenas Arrow y los métodos .str usan sus kernels nativos
+try:
+    import pyarrow
+    import pyarrow.parquet as pq
+    PYARROW_DISPONIBLE = True
+except ImportError:
+    PYARROW_DISPONIBLE = False
+
+# Columnas de texto que se limpian con métodos .str en cada dataset
+COLUMNAS_TEXTO = {
+    'ecommerce': ['precio', 'descripcion'],
+    'clientes': ['nombre', 'email', 'telefono', 'direccion'],
+    'temporal': ['timestamp']
+}
+
+# Entrada de los metadatos del esquema Parquet con la clave de la caché
+CLAVE_METADATOS_CACHE = b'pildora_clave_cache'
+
+# Ficheros CSV de cada dataset de demostración
+RUTAS_DATASETS = {
+    'ecommerce': 'datos_ejemplo/ecommerce_sucio.csv',
+    'clientes': 'datos_ejemplo/clientes_sucio.csv',
+    'temporal': 'datos_ejemplo/temporal_sucio.csv',
+    'outliers': 'datos_ejemplo/outliers_demo.csv'
+}
+
+# Tipos de cada dataset al leerlo: float32/int32 para los números y
+# category para el texto con pocos valores distintos. Las fechas se leen
+# como texto ('string'): se limpian después y el lector de pyarrow, si no,
+# convertiría por su cuenta las columnas con formato ISO
+DTYPES_DATASETS = {
+    'ecommerce': {
+        'categoria': 'category', 'stock': 'int32',
+        'rating': 'float32', 'reviews': 'int32',
+        'fecha_creacion': 'string'
+    },
+    'clientes': {
+        'edad': 'int32', 'total_compras': 'float32',
+        'fecha_registro': 'string', 'ultima_compra': 'string'
+    },
+    'temporal': {
+        'timestamp': 'string',
+        'temperatura': 'float32', 'humedad': 'int32', 'presion': 'float32',
+        'zona_horaria': 'category', 'estacion': 'category'
+    },
+    'outliers': {
+        'precio': 'float32', 'cantidad': 'int32', 'descuento': 'float32',
+        'edad_cliente': 'float32', 'satisfaccion': 'float32',
+        'id': 'int32', 'tipo': 'category'
+    }
+}
+
+# Configuración del pipeline automatizado que se muestra en la parte 4
+CONFIG_PIPELINE_DEMO = {
+    'eliminar_duplicados': True,
+    'manejar_nulos': True,
+    'estandarizar_texto': True,
+    'detectar_outliers': True,
+    'validar_formatos': True,
+    'metodo_imputacion': 'median',
+    'umbral_outliers': 2.5
+}
+
+# Filas por bloque al leer CSV en modo de lectura por bloques
+FILAS_POR_BLOQUE_CSV = 50_000
+
+# Límites de puntos al dibujar la serie temporal: por encima se diezma la
+# serie y, si aún son muchos, se dibuja sin marcadores
+MAX_PUNTOS_SERIE = 2000
+MAX_PUNTOS_CON_MARCADOR = 500
+
+# Porciones máximas en los gráficos de tarta; el resto se agrupa en 'Otros'
+MAX_PORCIONES_TARTA = 8
+
+def leer_csv(ruta_csv, dtype=None, filas_por_bloque=None):
+    """
+    Lee un CSV completo o, con filas_por_bloque, por bloques
+    
+    La lectura completa usa el motor de pyarrow si está instalado. La
+    lectura por bloques (solo con el motor de C) limita la memoria del
+    parser en ficheros grandes; los bloques se unen al final.
+    
+    Args:
+        ruta_csv: Ruta del fichero CSV
+        dtype: Tipos de columna para read_csv
+        filas_por_bloque: Filas por bloque (None lee el fichero de una vez)
+        
+    Returns:
+        DataFrame con los datos del CSV
+    """
+    if filas_por_bloque is None:
+        # El lector CSV de pyarrow es multihilo; el de C queda como respaldo
+        engine = 'pyarrow' if PYARROW_DISPONIBLE else 'c'
+        return pd.read_csv(ruta_csv, dtype=dtype, engine=engine)
+    
+    bloques = pd.read_csv(ruta_csv, dtype=dtype, chunksize=filas_por_bloque)
+    df = pd.concat(bloques, ignore_index=True)
+    
+    # Cada bloque infiere sus propias categorías y concat las pierde si no
+    # coinciden: reaplicar los tipos sobre el resultado
+    return df.astype(dtype) if dtype else df
+
+def clave_cache_parquet(dtype=None, filas_por_bloque=None):
+    """
+    Clave que identifica cómo se leyó un CSV cacheado en Parquet
+    
+    Recoge los tipos pedidos y el modo de lectura (completa o por bloques,
+    que infieren los tipos con motores distintos); el tamaño del bloque no
+    cambia el resultado y no forma parte de la clave.
+    
+    Args:
+        dtype: Tipos de columna para read_csv
+        filas_por_bloque: Filas por bloque (None si se lee de una vez)
+        
+    Returns:
+        Clave como bytes, para los metadatos del esquema Parquet
+    """
+    tipos = {columna: str(tipo) for columna, tipo in (dtype or {}).items()}
+    lectura = 'completa' if filas_por_bloque is None else 'bloques'
+    return json.dumps({'dtype': tipos, 'lectura': lectura}, sort_keys=True).encode()
+
+def leer_csv_con_cache(ruta_csv, dtype=None, filas_por_bloque=None):
+    """
+    Lee un CSV usando una copia Parquet junto a él como caché
+    
+    La primera lectura parsea el CSV y guarda el .parquet; las siguientes
+    leen el Parquet (binario y tipado) mientras sea más reciente que el CSV
+    y se haya guardado con los mismos tipos y modo de lectura (ver
+    clave_cache_parquet). Sin pyarrow se lee siempre el CSV.
+    
+    Args:
+        ruta_csv: Ruta del fichero CSV
+        dtype: Tipos de columna para read_csv (el Parquet ya los conserva)
+        filas_por_bloque: Si se indica, el CSV se lee por bloques (ver leer_csv)
+        
+    Returns:
+        DataFrame con los datos del CSV
+    """
+    if not PYARROW_DISPONIBLE:
+        return leer_csv(ruta_csv, dtype, filas_por_bloque)
+    
+    ruta_parquet = os.path.splitext(ruta_csv)[0] + '.parquet'
+    clave = clave_cache_parquet(dtype, filas_por_bloque)
+    # getmtime del CSV lanza FileNotFoundError si falta, como read_csv
+    mtime_csv = os.path.getmtime(ruta_csv)
+    if os.path.exists(ruta_parquet) and os.path.getmtime(ruta_parquet) >= mtime_csv:
+        try:
+            metadatos = pq.read_schema(ruta_parquet).metadata or {}
+            if metadatos.get(CLAVE_METADATOS_CACHE) == clave:
+                return pd.read_parquet(ruta_parquet, engine='pyarrow')
+        except (OSError, ValueError):
+            # Parquet ilegible (p. ej. escrito a medias): se regenera
+            pass
+    
+    df = leer_csv(ruta_csv, dtype, filas_por_bloque)
+    
+    tabla = pyarrow.Table.from_pandas(df)
+    tabla = tabla.replace_schema_metadata(
+        {**(tabla.schema.metadata or {}), CLAVE_METADATOS_CACHE: clave}
+    )
+    # Escribir en un temporal del mismo directorio y sustituir de golpe:
+    # una escritura interrumpida nunca deja un .parquet truncado
+    try:
+        descriptor, ruta_temporal = tempfile.mkstemp(
+            suffix='.parquet.tmp', dir=os.path.dirname(ruta_parquet) or '.'
+        )
+    except OSError:
+        # Directorio de solo lectura: seguir sin caché
+        return df
+    
+    try:
+        os.close(descriptor)
+        pq.write_table(tabla, ruta_temporal, compression='zstd')
+        os.replace(ruta_temporal, ruta_parquet)
+    except OSError:
+        pass
+    finally:
+        if os.path.exists(ruta_temporal):
+            os.remove(ruta_temporal)
+    return df
+
+def huella_datos(*dataframes):
+    """Huella del contenido de uno o varios DataFrames, para saber si cambiaron"""
+    return tuple(
+        (tuple(df.columns), int(pd.util.hash_pandas_object(df).sum()))
+        for df in dataframes
+    )
+
+def conteos_para_tarta(serie, max_porciones=MAX_PORCIONES_TARTA):
+    """
+    Cuenta los valores de una serie para un gráfico de tarta
+    
+    Se quedan las max_porciones categorías más frecuentes y el resto se suma
+    en 'Otros'; las categorías sin registros no se dibujan.
+    
+    Args:
+        serie: Serie con los valores a contar
+        max_porciones: Número máximo de categorías propias
+        
+    Returns:
+        Tupla (valores, etiquetas) como arrays NumPy
+    """
+    conteos = serie.value_counts()
+    conteos = conteos[conteos > 0]
+    principales = conteos.head(max_porciones)
+    otros = conteos.iloc[max_porciones:].sum()
+    
+    valores = principales.to_numpy()
+    etiquetas = principales.index.astype(str).to_numpy()
+    if otros:
+        valores = np.append(valores, otros)
+        etiquetas = np.append(etiquetas, 'Otros')
+    
+    return valores, etiquetas
+
+def dibujar_histograma(ax, valores, bins, **estilo):
+    """
+    Dibuja un histograma agrupando los valores con NumPy
+    
+    Equivale a ax.hist, pero las barras ya llegan contadas: matplotlib no
+    repite el agrupado. Los valores nulos se ignoran.
+    
+    Args:
+        ax: Ejes donde dibujar
+        valores: Serie o array con los valores
+        bins: Número de intervalos
+        **estilo: Opciones de estilo para ax.bar (color, alpha, ...)
+    """
+    valores = np.asarray(valores, dtype=float)
+    valores = valores[~np.isnan(valores)]
+    conteos, bordes = np.histogram(valores, bins=bins)
+    ax.bar(bordes[:-1], conteos, width=np.diff(bordes), align='edge', **estilo)
 
 # Función para importar módulos con nombres que empiezan con números
 def importar_modulo(nombre_archivo, nombre_modulo):
@@ -73,6 +331,7 @@ try:
     DataCleaner = pipeline_automatizado.DataCleaner
     ValidadorCalidad = pipeline_automatizado.ValidadorCalidad
     crear_datos_demo = pipeline_automatizado.crear_datos_demo
+    resumen_calidad = pipeline_automatizado.resumen_calidad
     demostrar_pipeline = pipeline_automatizado.demostrar_pipeline
     
 except ImportError as e:
@@ -85,16 +344,34 @@ class PresentacionInteractiva:
     
     def __init__(self):
         self.datos_cargados = {}
+        # Fecha de modificación de cada CSV en la última carga
+        self.mtimes_datos = {}
         self.resultados = {}
+        # Figuras reutilizables y huella de los datos de cada PNG guardado
+        self.figuras = {}
+        self.huellas_guardadas = {}
+        # Limpiadores compartidos por todas las partes: sus regex se
+        # compilan una sola vez por presentación
+        self.limpiador_texto = LimpiadorTexto()
+        self.limpiador_ecommerce = LimpiadorEcommerce()
+        self.limpiador_temporal = LimpiadorTemporal()
+        # Pipelines reutilizables: el de la parte 4 y el básico de la demo rápida
+        self.limpiador_pipeline = DataCleaner(CONFIG_PIPELINE_DEMO)
+        self.limpiador_pipeline_basico = DataCleaner()
         self.configuracion = {
             'mostrar_graficos': True,
             'pausar_entre_secciones': True,
-            'guardar_resultados': True
+            'guardar_resultados': True,
+            # Leer los CSV por bloques para acotar la memoria con ficheros grandes
+            'lectura_por_bloques': False
         }
     
     def limpiar_pantalla(self):
         """Limpia la pantalla de la consola"""
-        os.system('clear' if os.name == 'posix' else 'cls')
+        # Secuencia ANSI (borrar pantalla y cursor al inicio): sin lanzar
+        # un proceso 'clear'/'cls' en cada cambio de sección
+        sys.stdout.write('\033[2J\033[H')
+        sys.stdout.flush()
     
     def pausar(self, mensaje="Presiona Enter para continuar..."):
         """Pausa la ejecución esperando input del usuario"""
@@ -107,29 +384,78 @@ class PresentacionInteractiva:
         print(f"{titulo}")
         print(f"{caracter * 60}")
     
+    def leer_mtimes_datos(self):
+        """Devuelve la fecha de modificación de cada CSV de demostración existente"""
+        return {
+            ruta: os.path.getmtime(ruta)
+            for ruta in RUTAS_DATASETS.values()
+            if os.path.exists(ruta)
+        }
+    
     def cargar_datos_demo(self):
         """Carga los datasets de demostración"""
+        # Ya cargados y sin cambios en disco: volver al menú no relee nada
+        if self.datos_cargados and self.mtimes_datos == self.leer_mtimes_datos():
+            return
+        
         print("📊 Cargando datasets de demostración...")
         
-        try:
-            # Cargar datasets desde archivos CSV
-            self.datos_cargados = {
-                'ecommerce': pd.read_csv('datos_ejemplo/ecommerce_sucio.csv'),
-                'clientes': pd.read_csv('datos_ejemplo/clientes_sucio.csv'),
-                'temporal': pd.read_csv('datos_ejemplo/temporal_sucio.csv'),
-                'outliers': pd.read_csv('datos_ejemplo/outliers_demo.csv')
-            }
-            
-            print("✅ Datasets cargados exitosamente:")
-            for nombre, df in self.datos_cargados.items():
-                print(f"  📦 {nombre}: {len(df)} filas, {len(df.columns)} columnas")
-            
-        except FileNotFoundError:
+        # Generar los datasets antes de leer nada si falta alguno, en lugar
+        # de descubrirlo a mitad de la carga y tener que repetirla entera
+        if not all(os.path.exists(ruta) for ruta in RUTAS_DATASETS.values()):
             print("⚠️ Archivos de datos no encontrados. Creando datasets...")
-            # Crear datasets si no existen
             from datos_ejemplo.crear_datasets_demo import guardar_datasets
             guardar_datasets()
-            self.cargar_datos_demo()
+        
+        # Cargar datasets desde archivos CSV (o su caché Parquet); los
+        # lectores de pandas/pyarrow liberan el GIL, así que los cuatro
+        # ficheros se leen en paralelo con hilos
+        filas_por_bloque = (
+            FILAS_POR_BLOQUE_CSV if self.configuracion['lectura_por_bloques'] else None
+        )
+        with ThreadPoolExecutor(max_workers=len(RUTAS_DATASETS)) as executor:
+            datasets = executor.map(
+                lambda nombre: leer_csv_con_cache(
+                    RUTAS_DATASETS[nombre],
+                    dtype=DTYPES_DATASETS[nombre],
+                    filas_por_bloque=filas_por_bloque
+                ),
+                RUTAS_DATASETS
+            )
+            self.datos_cargados = dict(zip(RUTAS_DATASETS, datasets))
+        
+        if PYARROW_DISPONIBLE:
+            self.convertir_texto_a_arrow()
+        
+        self.mtimes_datos = self.leer_mtimes_datos()
+        
+        print("✅ Datasets cargados exitosamente:")
+        for nombre, df in self.datos_cargados.items():
+            memoria_kb = df.memory_usage(deep=True).sum() / 1024
+            print(f"  📦 {nombre}: {len(df)} filas, {len(df.columns)} columnas ({memoria_kb:.1f} KB)")
+    
+    def obtener_dataset(self, nombre):
+        """
+        Devuelve una copia de un dataset cargado
+        
+        Los datasets se conservan entre ejecuciones del menú: cada parte
+        trabaja sobre su propia copia para no alterar la versión cargada.
+        
+        Args:
+            nombre: Clave del dataset en RUTAS_DATASETS
+            
+        Returns:
+            Copia del DataFrame
+        """
+        return self.datos_cargados[nombre].copy()
+    
+    def convertir_texto_a_arrow(self):
+        """Convierte las columnas de texto de los datasets a cadenas Arrow"""
+        for nombre, columnas in COLUMNAS_TEXTO.items():
+            df = self.datos_cargados[nombre]
+            self.datos_cargados[nombre] = df.astype(
+                {columna: 'string[pyarrow]' for columna in columnas}
+            )
     
     def introduccion(self):
         """Introducción de la presentación"""
@@ -165,7 +491,7 @@ class PresentacionInteractiva:
         print()
         
         # Usar datos de outliers
-        df = self.datos_cargados['outliers']
+        df = self.obtener_dataset('outliers')
         columnas_numericas = ['precio', 'cantidad', 'descuento', 'edad_cliente', 'satisfaccion']
         
         print(f"📊 Dataset: {len(df)} registros")
@@ -173,13 +499,18 @@ class PresentacionInteractiva:
         print()
         
         # Mostrar estadísticas básicas
-        print("📈 ESTADÍSTICAS BÁSICAS:")
-        print(df[columnas_numericas].describe().round(2))
-        print()
-        
-        # Comparar métodos
-        print("🔍 COMPARANDO MÉTODOS DE DETECCIÓN:")
-        df_comparacion = comparar_metodos_outliers(df, columnas_numericas)
+        # Solo aquí se esperan avisos numéricos (columnas constantes o con
+        # NaN): silenciarlos en este bloque y no en todo el programa
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            
+            print("📈 ESTADÍSTICAS BÁSICAS:")
+            print(df[columnas_numericas].describe().round(2))
+            print()
+            
+            # Comparar métodos
+            print("🔍 COMPARANDO MÉTODOS DE DETECCIÓN:")
+            df_comparacion = comparar_metodos_outliers(df, columnas_numericas)
         
         print("\n💡 CUÁNDO USAR CADA MÉTODO:")
         print("• Z-Score: Datos normalmente distribuidos")
@@ -188,8 +519,9 @@ class PresentacionInteractiva:
         print()
         
         # Crear visualizaciones
-        print("📊 CREANDO VISUALIZACIONES...")
-        self.crear_visualizacion_outliers(df_comparacion, columnas_numericas)
+        if self.visualizaciones_activas():
+            print("📊 CREANDO VISUALIZACIONES...")
+            self.crear_visualizacion_outliers(df_comparacion, columnas_numericas)
         
         # Guardar resultados
         self.resultados['outliers'] = df_comparacion
@@ -207,27 +539,35 @@ class PresentacionInteractiva:
         print()
         
         # Usar datos de clientes
-        df = self.datos_cargados['clientes']
-        limpiador = LimpiadorTexto()
+        df = self.obtener_dataset('clientes')
+        limpiador = self.limpiador_texto
+        
+        # Limpiar todas las columnas y añadirlas al DataFrame de una vez
+        df = df.assign(
+            telefono_limpio=limpiador.limpiar_telefonos(df['telefono']),
+            email_limpio=limpiador.limpiar_emails(df['email']),
+            nombre_limpio=limpiador.limpiar_nombres(df['nombre']),
+            direccion_limpia=limpiador.limpiar_direcciones(df['direccion'])
+        )
+        
+        # Registros no nulos de cada columna (originales y limpias) en una
+        # sola pasada; las visualizaciones reutilizan los mismos conteos
+        validos = df.notna().sum()
         
         print("📞 LIMPIEZA DE TELÉFONOS:")
-        df['telefono_limpio'] = df['telefono'].apply(limpiador.limpiar_telefono)
-        print(f"Teléfonos válidos: {df['telefono_limpio'].notna().sum()}/{len(df)}")
+        print(f"Teléfonos válidos: {validos['telefono_limpio']}/{len(df)}")
         print()
         
         print("📧 LIMPIEZA DE EMAILS:")
-        df['email_limpio'] = df['email'].apply(limpiador.limpiar_email)
-        print(f"Emails válidos: {df['email_limpio'].notna().sum()}/{len(df)}")
+        print(f"Emails válidos: {validos['email_limpio']}/{len(df)}")
         print()
         
         print("👤 LIMPIEZA DE NOMBRES:")
-        df['nombre_limpio'] = df['nombre'].apply(limpiador.limpiar_nombre)
-        print(f"Nombres válidos: {df['nombre_limpio'].notna().sum()}/{len(df)}")
+        print(f"Nombres válidos: {validos['nombre_limpio']}/{len(df)}")
         print()
         
         print("🏠 LIMPIEZA DE DIRECCIONES:")
-        df['direccion_limpia'] = df['direccion'].apply(limpiador.limpiar_direccion)
-        print(f"Direcciones válidas: {df['direccion_limpia'].notna().sum()}/{len(df)}")
+        print(f"Direcciones válidas: {validos['direccion_limpia']}/{len(df)}")
         print()
         
         print("🔧 PATRONES REGEX CLAVE:")
@@ -237,8 +577,9 @@ class PresentacionInteractiva:
         print()
         
         # Crear visualizaciones
-        print("📊 CREANDO VISUALIZACIONES...")
-        self.crear_visualizacion_texto(df)
+        if self.visualizaciones_activas():
+            print("📊 CREANDO VISUALIZACIONES...")
+            self.crear_visualizacion_texto(df, validos)
         
         # Guardar resultados
         self.resultados['texto'] = df
@@ -264,13 +605,18 @@ class PresentacionInteractiva:
         print("• Descripciones con HTML")
         print()
         
-        df_ecommerce = self.datos_cargados['ecommerce']
-        limpiador_ecommerce = LimpiadorEcommerce()
+        df_ecommerce = self.obtener_dataset('ecommerce')
+        limpiador_ecommerce = self.limpiador_ecommerce
         
-        # Aplicar limpiezas
-        df_ecommerce['precio_normalizado'] = df_ecommerce['precio'].apply(limpiador_ecommerce.normalizar_precio)
-        df_ecommerce['categoria_limpia'] = df_ecommerce['categoria'].apply(limpiador_ecommerce.limpiar_categoria)
-        df_ecommerce['descripcion_limpia'] = df_ecommerce['descripcion'].apply(limpiador_ecommerce.limpiar_descripcion)
+        # Aplicar limpiezas (todas las columnas nuevas en una sola asignación).
+        # categoria_limpia como category: value_counts cuenta códigos enteros
+        df_ecommerce = df_ecommerce.assign(
+            precio_normalizado=limpiador_ecommerce.normalizar_precios(df_ecommerce['precio']),
+            categoria_limpia=limpiador_ecommerce.limpiar_categorias(
+                df_ecommerce['categoria']
+            ).astype('category'),
+            descripcion_limpia=limpiador_ecommerce.limpiar_descripciones(df_ecommerce['descripcion'])
+        )
         
         print(f"Precios normalizados: {df_ecommerce['precio_normalizado'].notna().sum()}/{len(df_ecommerce)}")
         print(f"Categorías únicas: {df_ecommerce['categoria_limpia'].nunique()}")
@@ -285,11 +631,13 @@ class PresentacionInteractiva:
         print("• Gaps temporales")
         print()
         
-        df_temporal = self.datos_cargados['temporal']
-        limpiador_temporal = LimpiadorTemporal()
+        df_temporal = self.obtener_dataset('temporal')
+        limpiador_temporal = self.limpiador_temporal
         
         # Parsear fechas
-        df_temporal['timestamp_parsed'] = df_temporal['timestamp'].apply(limpiador_temporal.parsear_fecha_flexible)
+        df_temporal = df_temporal.assign(
+            timestamp_parsed=limpiador_temporal.parsear_fechas(df_temporal['timestamp'])
+        )
         print(f"Fechas parseadas: {df_temporal['timestamp_parsed'].notna().sum()}/{len(df_temporal)}")
         print()
         
@@ -300,8 +648,9 @@ class PresentacionInteractiva:
         print()
         
         # Crear visualizaciones para casos prácticos
-        print("📊 CREANDO VISUALIZACIONES...")
-        self.crear_visualizacion_casos_practicos(df_ecommerce, df_temporal)
+        if self.visualizaciones_activas():
+            print("📊 CREANDO VISUALIZACIONES...")
+            self.crear_visualizacion_casos_practicos(df_ecommerce, df_temporal)
         
         # Guardar resultados
         self.resultados['casos'] = {
@@ -321,35 +670,29 @@ class PresentacionInteractiva:
         print("Vamos a ver cómo crear un pipeline reutilizable.")
         print()
         
-        # Crear datos de demostración
+        # Crear datos de demostración y describirlos antes de limpiarlos
         df_demo = crear_datos_demo()
-        print(f"📊 Datos de demostración: {len(df_demo)} filas")
-        print(f"❌ Valores nulos: {df_demo.isnull().sum().sum()}")
-        print(f"🔄 Duplicados: {df_demo.duplicated().sum()}")
-        print()
-        
-        # Configurar pipeline
-        config = {
-            'eliminar_duplicados': True,
-            'manejar_nulos': True,
-            'estandarizar_texto': True,
-            'detectar_outliers': True,
-            'validar_formatos': True,
-            'metodo_imputacion': 'median',
-            'umbral_outliers': 2.5
-        }
+        inicial = resumen_calidad(df_demo)
+        
+        print(f"📊 Datos de demostración: {inicial['filas']} filas")
+        print(f"❌ Valores nulos: {inicial['nulos_totales']}")
+        print(f"🔄 Duplicados: {inicial['duplicados']}")
+        print()
         
-        # Crear limpiador
-        limpiador = DataCleaner(config)
+        # Pipeline configurado una vez en __init__ (ver CONFIG_PIPELINE_DEMO)
+        limpiador = self.limpiador_pipeline
         
         # Aplicar limpieza
         print("🚀 Ejecutando pipeline...")
         df_limpio = limpiador.fit_transform(df_demo)
         
+        # Los conteos finales ya se calcularon dentro de fit_transform
+        final = limpiador.estadisticas['final']
+        
         print(f"✅ Pipeline completado:")
-        print(f"  📊 Filas finales: {len(df_limpio)}")
-        print(f"  ❌ Valores nulos: {df_limpio.isnull().sum().sum()}")
-        print(f"  🔄 Duplicados: {df_limpio.duplicated().sum()}")
+        print(f"  📊 Filas finales: {final['filas']}")
+        print(f"  ❌ Valores nulos: {final['nulos_totales']}")
+        print(f"  🔄 Duplicados: {final['duplicados']}")
         print()
         
         # Generar reporte
@@ -361,8 +704,9 @@ class PresentacionInteractiva:
         print()
         
         # Crear visualizaciones del pipeline
-        print("📊 CREANDO VISUALIZACIONES...")
-        self.crear_visualizacion_pipeline(df_demo, df_limpio, reporte)
+        if self.visualizaciones_activas():
+            print("📊 CREANDO VISUALIZACIONES...")
+            self.crear_visualizacion_pipeline(df_demo, df_limpio, reporte)
         
         # Guardar resultados
         self.resultados['pipeline'] = {
@@ -482,24 +826,27 @@ class PresentacionInteractiva:
         
         # Demo rápida de outliers
         print("🔍 DETECCIÓN DE OUTLIERS:")
-        df_outliers = self.datos_cargados['outliers']
-        df_resultado = detectar_outliers_isolation_forest(df_outliers, ['precio', 'cantidad'])
+        df_outliers = self.obtener_dataset('outliers')
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            df_resultado = detectar_outliers_isolation_forest(df_outliers, ['precio', 'cantidad'])
         print(f"Outliers detectados: {df_resultado['outlier_isolation'].sum()}")
         print()
         
         # Demo rápida de limpieza de texto
         print("🧹 LIMPIEZA DE TEXTO:")
-        limpiador = LimpiadorTexto()
-        df_texto = self.datos_cargados['clientes']
-        df_texto['telefono_limpio'] = df_texto['telefono'].apply(limpiador.limpiar_telefono)
+        limpiador = self.limpiador_texto
+        df_texto = self.obtener_dataset('clientes')
+        df_texto = df_texto.assign(
+            telefono_limpio=limpiador.limpiar_telefonos(df_texto['telefono'])
+        )
         print(f"Teléfonos válidos: {df_texto['telefono_limpio'].notna().sum()}")
         print()
         
         # Demo rápida de pipeline
         print("⚙️ PIPELINE AUTOMATIZADO:")
         df_demo = crear_datos_demo()
-        cleaner = DataCleaner()
-        df_limpio = cleaner.fit_transform(df_demo)
+        df_limpio = self.limpiador_pipeline_basico.fit_transform(df_demo)
         print(f"Pipeline completado: {len(df_limpio)} filas procesadas")
         print()
         
@@ -514,36 +861,112 @@ class PresentacionInteractiva:
         if not self.datos_cargados:
             self.cargar_datos_demo()
         
+        # Componer el listado completo y escribirlo con un solo print
+        lineas = []
         for nombre, df in self.datos_cargados.items():
-            print(f"📦 {nombre.upper()}:")
-            print(f"  Filas: {len(df)}")
-            print(f"  Columnas: {len(df.columns)}")
-            print(f"  Columnas: {', '.join(df.columns[:5])}{'...' if len(df.columns) > 5 else ''}")
-            print()
+            n_columnas = len(df.columns)
+            lineas += [
+                f"📦 {nombre.upper()}:",
+                f"  Filas: {len(df)}",
+                f"  Columnas: {n_columnas}",
+                f"  Columnas: {', '.join(df.columns[:5])}{'...' if n_columnas > 5 else ''}",
+                ""
+            ]
+        print("\n".join(lineas))
         
         self.pausar("Presiona Enter para volver al menú...")
     
+    def visualizaciones_activas(self):
+        """Indica si hay que dibujar: solo si los gráficos se muestran o se guardan"""
+        return self.configuracion['mostrar_graficos'] or self.configuracion['guardar_resultados']
+    
+    def obtener_figura(self, nombre, filas, columnas, figsize):
+        """
+        Devuelve la figura de una visualización, reutilizándola entre llamadas
+        
+        Args:
+            nombre: Clave de la visualización
+            filas: Filas de la rejilla de subplots
+            columnas: Columnas de la rejilla de subplots
+            figsize: Tamaño de la figura
+            
+        Returns:
+            Tupla (fig, axes) con todos los ejes vacíos
+        """
+        preparar_estilo_graficos()
+        
+        # Sin mostrar los gráficos no hace falta pyplot: una Figure con su
+        # lienzo Agg no se registra en el gestor de figuras ni abre ventanas
+        con_pyplot = self.configuracion['mostrar_graficos']
+        fig_axes = self.figuras.get(nombre)
+        
+        # Hay que crearla si no existe, si se cerró su ventana o si cambió
+        # el modo (con o sin pyplot) desde que se creó
+        if fig_axes is not None and fig_axes[2] != con_pyplot:
+            if fig_axes[2]:
+                plt.close(fig_axes[0])
+            fig_axes = None
+        if fig_axes is None or (con_pyplot and not plt.fignum_exists(fig_axes[0].number)):
+            # constrained_layout recoloca los ejes al dibujar, sin la pasada
+            # extra de tight_layout antes de guardar
+            if con_pyplot:
+                fig, axes = plt.subplots(filas, columnas, figsize=figsize, constrained_layout=True)
+            else:
+                fig = Figure(figsize=figsize, constrained_layout=True)
+                FigureCanvasAgg(fig)
+                axes = fig.subplots(filas, columnas)
+            fig_axes = (fig, axes, con_pyplot)
+            self.figuras[nombre] = fig_axes
+        else:
+            for ax in np.ravel(fig_axes[1]):
+                ax.cla()
+        
+        return fig_axes[0], fig_axes[1]
+    
+    def finalizar_figura(self, fig, ruta, huella):
+        """
+        Guarda y muestra una visualización
+        
+        El PNG solo se vuelve a escribir si los datos dibujados cambiaron
+        desde el último guardado.
+        
+        Args:
+            fig: Figura a finalizar
+            ruta: Fichero PNG de destino
+            huella: Huella de los datos dibujados (ver huella_datos)
+        """
+        guardar = self.configuracion['guardar_resultados']
+        if guardar and (self.huellas_guardadas.get(ruta) != huella or not os.path.exists(ruta)):
+            fig.savefig(ruta, **SAVEFIG_KW)
+            self.huellas_guardadas[ruta] = huella
+        
+        # Con Agg (o con los gráficos desactivados) no hay ventana que mostrar
+        if self.configuracion['mostrar_graficos'] and plt.get_backend().lower() != 'agg':
+            plt.show()
+        
+        if guardar:
+            print(f"✅ Visualización guardada como '{ruta}'")
+    
     def crear_visualizacion_outliers(self, df, columnas):
         """Crea visualizaciones para la detección de outliers"""
         try:
-            fig, axes = plt.subplots(2, 3, figsize=(18, 12))
+            fig, axes = self.obtener_figura('outliers', 2, 3, (18, 12))
             axes = axes.ravel()
             
             # Métodos de detección
             metodos = ['zscore', 'iqr', 'isolation']
             
+            # Los datos de los box plots son los mismos para los tres métodos:
+            # un único bloque NumPy (una columna por variable, máximo 4)
+            etiquetas = columnas[:4]
+            datos_box = df[etiquetas].to_numpy(dtype=np.float32)
+            
             for i, metodo in enumerate(metodos):
                 if f'outlier_{metodo}' in df.columns:
                     # Box plot para cada método
                     ax = axes[i]
-                    datos_por_columna = []
-                    etiquetas = []
-                    
-                    for col in columnas[:4]:  # Máximo 4 columnas
-                        datos_por_columna.append(df[col])
-                        etiquetas.append(col)
-                    
-                    bp = ax.boxplot(datos_por_columna, labels=etiquetas, patch_artist=True)
+                    bp = ax.boxplot(datos_box, patch_artist=True)
+                    ax.set_xticklabels(etiquetas)
                     ax.set_title(f'Box Plot - Método {metodo.upper()}')
                     ax.set_ylabel('Valores')
                     ax.tick_params(axis='x', rotation=45)
@@ -555,11 +978,14 @@ class PresentacionInteractiva:
             # Scatter plot comparativo
             ax = axes[3]
             if 'outlier_isolation' in df.columns:
-                outliers_mask = df['outlier_isolation']
-                ax.scatter(df[~outliers_mask].index, df[~outliers_mask]['precio'], 
-                          alpha=0.6, label='Normal', color='blue', s=20)
-                ax.scatter(df[outliers_mask].index, df[outliers_mask]['precio'], 
-                          alpha=0.8, label='Outlier', color='red', s=50)
+                # Arrays NumPy: dos selecciones booleanas, sin DataFrames intermedios
+                outliers_mask = df['outlier_isolation'].to_numpy(dtype=bool)
+                indices = df.index.to_numpy()
+                precios = df['precio'].to_numpy()
+                ax.scatter(indices[~outliers_mask], precios[~outliers_mask], 
+                          alpha=0.6, label='Normal', color='blue', s=20, rasterized=True)
+                ax.scatter(indices[outliers_mask], precios[outliers_mask], 
+                          alpha=0.8, label='Outlier', color='red', s=50, rasterized=True)
                 ax.set_title('Outliers en Precio (Isolation Forest)')
                 ax.set_xlabel('Índice del registro')
                 ax.set_ylabel('Precio')
@@ -580,36 +1006,36 @@ class PresentacionInteractiva:
                 
                 # Agregar valores en las barras
                 for i, v in enumerate(comparacion):
-                    ax.text(i, v + 0.5, str(v), ha='center', va='bottom')
+                    ax.text(i, v + 0.5, f'{v}', ha='center', va='bottom')
             
             # Distribución de datos
             ax = axes[5]
             if 'precio' in df.columns:
-                ax.hist(df['precio'], bins=30, alpha=0.7, color='lightcoral', edgecolor='black')
+                dibujar_histograma(ax, df['precio'], bins=30, alpha=0.7, color='lightcoral', edgecolor='black')
                 ax.set_title('Distribución de Precios')
                 ax.set_xlabel('Precio')
                 ax.set_ylabel('Frecuencia')
                 ax.grid(True, alpha=0.3)
             
-            plt.tight_layout()
-            plt.savefig('visualizacion_outliers.png', dpi=300, bbox_inches='tight')
-            plt.show()
-            
-            print("✅ Visualización guardada como 'visualizacion_outliers.png'")
+            self.finalizar_figura(fig, 'visualizacion_outliers.png', huella_datos(df) + (tuple(columnas),))
             
         except Exception as e:
             print(f"⚠️ Error creando visualización: {e}")
     
-    def crear_visualizacion_texto(self, df):
+    def crear_visualizacion_texto(self, df, validos=None):
         """Crea visualizaciones para la limpieza de texto"""
         try:
-            fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+            fig, axes = self.obtener_figura('texto', 2, 2, (15, 10))
+            
+            # Conteos de no nulos por columna (si no vienen ya calculados)
+            if validos is None:
+                validos = df.notna().sum()
             
             # Antes vs Después de limpieza de teléfonos
             ax = axes[0, 0]
             if 'telefono' in df.columns and 'telefono_limpio' in df.columns:
-                antes = df['telefono'].notna().sum()
-                despues = df['telefono_limpio'].notna().sum()
+                antes = validos['telefono']
+                despues = validos['telefono_limpio']
                 
                 ax.bar(['Antes', 'Después'], [antes, despues], 
                       color=['lightcoral', 'lightgreen'])
@@ -617,14 +1043,14 @@ class PresentacionInteractiva:
                 ax.set_ylabel('Registros Válidos')
                 
                 # Agregar valores en las barras
-                ax.text(0, antes + 1, str(antes), ha='center', va='bottom')
-                ax.text(1, despues + 1, str(despues), ha='center', va='bottom')
+                ax.text(0, antes + 1, f'{antes}', ha='center', va='bottom')
+                ax.text(1, despues + 1, f'{despues}', ha='center', va='bottom')
             
             # Antes vs Después de limpieza de emails
             ax = axes[0, 1]
             if 'email' in df.columns and 'email_limpio' in df.columns:
-                antes = df['email'].notna().sum()
-                despues = df['email_limpio'].notna().sum()
+                antes = validos['email']
+                despues = validos['email_limpio']
                 
                 ax.bar(['Antes', 'Después'], [antes, despues], 
                       color=['lightcoral', 'lightgreen'])
@@ -632,31 +1058,27 @@ class PresentacionInteractiva:
                 ax.set_ylabel('Registros Válidos')
                 
                 # Agregar valores en las barras
-                ax.text(0, antes + 1, str(antes), ha='center', va='bottom')
-                ax.text(1, despues + 1, str(despues), ha='center', va='bottom')
+                ax.text(0, antes + 1, f'{antes}', ha='center', va='bottom')
+                ax.text(1, despues + 1, f'{despues}', ha='center', va='bottom')
             
             # Distribución de categorías limpias
             ax = axes[1, 0]
             if 'categoria_limpia' in df.columns:
-                categorias = df['categoria_limpia'].value_counts()
-                ax.pie(categorias.values, labels=categorias.index, autopct='%1.1f%%', startangle=90)
+                valores, etiquetas = conteos_para_tarta(df['categoria_limpia'])
+                ax.pie(valores, labels=etiquetas, autopct='%1.1f%%', startangle=90)
                 ax.set_title('Distribución de Categorías Limpias')
             
             # Longitud de descripciones limpias
             ax = axes[1, 1]
             if 'descripcion_limpia' in df.columns:
                 longitudes = df['descripcion_limpia'].str.len().dropna()
-                ax.hist(longitudes, bins=20, alpha=0.7, color='lightblue', edgecolor='black')
+                dibujar_histograma(ax, longitudes, bins=20, alpha=0.7, color='lightblue', edgecolor='black')
                 ax.set_title('Distribución de Longitudes de Descripciones')
                 ax.set_xlabel('Longitud de Caracteres')
                 ax.set_ylabel('Frecuencia')
                 ax.grid(True, alpha=0.3)
             
-            plt.tight_layout()
-            plt.savefig('visualizacion_texto.png', dpi=300, bbox_inches='tight')
-            plt.show()
-            
-            print("✅ Visualización guardada como 'visualizacion_texto.png'")
+            self.finalizar_figura(fig, 'visualizacion_texto.png', huella_datos(df))
             
         except Exception as e:
             print(f"⚠️ Error creando visualización: {e}")
@@ -664,13 +1086,22 @@ class PresentacionInteractiva:
     def crear_visualizacion_pipeline(self, df_antes, df_despues, reporte):
         """Crea visualizaciones para el pipeline automatizado"""
         try:
-            fig, axes = plt.subplots(2, 3, figsize=(18, 12))
+            fig, axes = self.obtener_figura('pipeline', 2, 3, (18, 12))
+            
+            # Conteos calculados por el pipeline: no volver a recorrer los
+            # datos; se leen una sola vez y se reutilizan en todos los gráficos
+            inicial = reporte['estadisticas']['inicial']
+            final = reporte['estadisticas']['final']
+            filas_antes = inicial['filas']
+            filas_despues = final['filas']
+            filas_eliminadas = filas_antes - filas_despues
+            nulos_antes = inicial['nulos_totales']
+            nulos_despues = final['nulos_totales']
+            celdas_antes = filas_antes * inicial['columnas']
+            celdas_despues = filas_despues * final['columnas']
             
             # Comparación de filas antes y después
             ax = axes[0, 0]
-            filas_antes = len(df_antes)
-            filas_despues = len(df_despues)
-            filas_eliminadas = filas_antes - filas_despues
             
             ax.bar(['Antes', 'Después'], [filas_antes, filas_despues], 
                   color=['lightcoral', 'lightgreen'])
@@ -678,30 +1109,27 @@ class PresentacionInteractiva:
             ax.set_ylabel('Número de Filas')
             
             # Agregar valores
-            ax.text(0, filas_antes + 1, str(filas_antes), ha='center', va='bottom')
-            ax.text(1, filas_despues + 1, str(filas_despues), ha='center', va='bottom')
+            ax.text(0, filas_antes + 1, f'{filas_antes}', ha='center', va='bottom')
+            ax.text(1, filas_despues + 1, f'{filas_despues}', ha='center', va='bottom')
             
             # Valores nulos antes y después
             ax = axes[0, 1]
-            nulos_antes = df_antes.isnull().sum().sum()
-            nulos_despues = df_despues.isnull().sum().sum()
-            
             ax.bar(['Antes', 'Después'], [nulos_antes, nulos_despues], 
                   color=['lightcoral', 'lightgreen'])
             ax.set_title('Valores Nulos Antes vs Después')
             ax.set_ylabel('Número de Valores Nulos')
             
             # Agregar valores
-            ax.text(0, nulos_antes + 0.5, str(nulos_antes), ha='center', va='bottom')
-            ax.text(1, nulos_despues + 0.5, str(nulos_despues), ha='center', va='bottom')
+            ax.text(0, nulos_antes + 0.5, f'{nulos_antes}', ha='center', va='bottom')
+            ax.text(1, nulos_despues + 0.5, f'{nulos_despues}', ha='center', va='bottom')
             
             # Duplicados eliminados
             ax = axes[0, 2]
-            duplicados = df_antes.duplicated().sum()
+            duplicados = inicial['duplicados']
             ax.bar(['Duplicados Eliminados'], [duplicados], color='orange')
             ax.set_title('Duplicados Eliminados')
             ax.set_ylabel('Número de Duplicados')
-            ax.text(0, duplicados + 0.1, str(duplicados), ha='center', va='bottom')
+            ax.text(0, duplicados + 0.1, f'{duplicados}', ha='center', va='bottom')
             
             # Transformaciones aplicadas
             ax = axes[1, 0]
@@ -710,12 +1138,12 @@ class PresentacionInteractiva:
                 ax.bar(['Transformaciones'], [transformaciones], color='purple')
                 ax.set_title('Transformaciones Aplicadas')
                 ax.set_ylabel('Número de Transformaciones')
-                ax.text(0, transformaciones + 0.1, str(transformaciones), ha='center', va='bottom')
+                ax.text(0, transformaciones + 0.1, f'{transformaciones}', ha='center', va='bottom')
             
             # Calidad de datos (antes vs después)
             ax = axes[1, 1]
-            calidad_antes = ((filas_antes - nulos_antes) / (filas_antes * len(df_antes.columns))) * 100
-            calidad_despues = ((filas_despues - nulos_despues) / (filas_despues * len(df_despues.columns))) * 100
+            calidad_antes = ((filas_antes - nulos_antes) / celdas_antes) * 100
+            calidad_despues = ((filas_despues - nulos_despues) / celdas_despues) * 100
             
             ax.bar(['Antes', 'Después'], [calidad_antes, calidad_despues], 
                   color=['lightcoral', 'lightgreen'])
@@ -737,18 +1165,15 @@ class PresentacionInteractiva:
             ]
             
             ax.text(0.1, 0.8, 'MEJORAS LOGRADAS:', fontsize=12, fontweight='bold', transform=ax.transAxes)
-            for i, mejora in enumerate(mejoras):
-                ax.text(0.1, 0.6 - i*0.15, mejora, fontsize=10, transform=ax.transAxes)
+            # Todas las líneas en un único Text (un artista en lugar de uno por línea)
+            ax.text(0.1, 0.62, '\n'.join(mejoras), fontsize=10, va='top',
+                   linespacing=4, transform=ax.transAxes)
             
             ax.set_xlim(0, 1)
             ax.set_ylim(0, 1)
             ax.axis('off')
             
-            plt.tight_layout()
-            plt.savefig('visualizacion_pipeline.png', dpi=300, bbox_inches='tight')
-            plt.show()
-            
-            print("✅ Visualización guardada como 'visualizacion_pipeline.png'")
+            self.finalizar_figura(fig, 'visualizacion_pipeline.png', huella_datos(df_antes, df_despues))
             
         except Exception as e:
             print(f"⚠️ Error creando visualización: {e}")
@@ -756,13 +1181,13 @@ class PresentacionInteractiva:
     def crear_visualizacion_casos_practicos(self, df_ecommerce, df_temporal):
         """Crea visualizaciones para los casos prácticos"""
         try:
-            fig, axes = plt.subplots(2, 3, figsize=(18, 12))
+            fig, axes = self.obtener_figura('casos_practicos', 2, 3, (18, 12))
             
             # E-commerce: Precios normalizados
             ax = axes[0, 0]
             if 'precio_normalizado' in df_ecommerce.columns:
-                precios = df_ecommerce['precio_normalizado'].dropna()
-                ax.hist(precios, bins=20, alpha=0.7, color='lightblue', edgecolor='black')
+                dibujar_histograma(ax, df_ecommerce['precio_normalizado'], bins=20,
+                                   alpha=0.7, color='lightblue', edgecolor='black')
                 ax.set_title('Distribución de Precios Normalizados (USD)')
                 ax.set_xlabel('Precio (USD)')
                 ax.set_ylabel('Frecuencia')
@@ -771,33 +1196,39 @@ class PresentacionInteractiva:
             # E-commerce: Categorías limpias
             ax = axes[0, 1]
             if 'categoria_limpia' in df_ecommerce.columns:
-                categorias = df_ecommerce['categoria_limpia'].value_counts()
-                ax.pie(categorias.values, labels=categorias.index, autopct='%1.1f%%', startangle=90)
+                valores, etiquetas = conteos_para_tarta(df_ecommerce['categoria_limpia'])
+                ax.pie(valores, labels=etiquetas, autopct='%1.1f%%', startangle=90)
                 ax.set_title('Distribución de Categorías Limpias')
             
             # E-commerce: Comparación antes/después
             ax = axes[0, 2]
             if 'precio' in df_ecommerce.columns and 'precio_normalizado' in df_ecommerce.columns:
                 try:
-                    # Extraer números de precios originales de forma más robusta
-                    precios_originales = []
-                    for precio_str in df_ecommerce['precio'].dropna():
-                        # Buscar números en el string
-                        import re
-                        numeros = re.findall(r'[\d,\.]+', str(precio_str))
-                        if numeros:
-                            try:
-                                # Convertir a float manejando formatos europeos/americanos
-                                num_str = numeros[0].replace(',', '.') if ',' in numeros[0] and '.' not in numeros[0] else numeros[0].replace(',', '')
-                                precios_originales.append(float(num_str))
-                            except:
-                                continue
+                    # Primer número de cada precio original, para toda la columna
+                    # (la columna ya suele ser texto: solo se convierte si no lo es)
+                    precios_texto = df_ecommerce['precio'].dropna()
+                    if not pd.api.types.is_string_dtype(precios_texto):
+                        precios_texto = precios_texto.astype(str)
+                    numeros = precios_texto.str.extract(RE_NUMERO, expand=False)
+                    
+                    # Formatos europeos/americanos: una coma sin punto es el
+                    # separador decimal; en otro caso las comas son de miles
+                    decimal_europeo = (
+                        numeros.str.contains(',', regex=False, na=False)
+                        & ~numeros.str.contains('.', regex=False, na=False)
+                    )
+                    numeros = numeros.str.replace(',', '', regex=False).mask(
+                        decimal_europeo, numeros.str.replace(',', '.', regex=False)
+                    )
                     
-                    precios_limpios = df_ecommerce['precio_normalizado'].dropna().tolist()
+                    # Lo que no sea un número válido (p. ej. '.') se descarta
+                    precios_originales = pd.to_numeric(numeros, errors='coerce').dropna().to_numpy()
                     
-                    if precios_originales and precios_limpios:
-                        ax.boxplot([precios_originales, precios_limpios], 
-                                  labels=['Originales', 'Normalizados'])
+                    precios_limpios = df_ecommerce['precio_normalizado'].dropna().to_numpy(dtype=np.float64)
+                    
+                    if len(precios_originales) and len(precios_limpios):
+                        ax.boxplot([precios_originales, precios_limpios])
+                        ax.set_xticklabels(['Originales', 'Normalizados'])
                         ax.set_title('Comparación de Precios')
                         ax.set_ylabel('Precio')
                         ax.grid(True, alpha=0.3)
@@ -815,8 +1246,11 @@ class PresentacionInteractiva:
             if 'timestamp_parsed' in df_temporal.columns and 'temperatura' in df_temporal.columns:
                 df_temp = df_temporal.dropna(subset=['timestamp_parsed', 'temperatura'])
                 if len(df_temp) > 0:
-                    ax.plot(df_temp['timestamp_parsed'], df_temp['temperatura'], 
-                           marker='o', markersize=3, alpha=0.7)
+                    paso = max(1, -(-len(df_temp) // MAX_PUNTOS_SERIE))
+                    df_plot = df_temp.iloc[::paso]
+                    marcador = 'o' if len(df_plot) < MAX_PUNTOS_CON_MARCADOR else None
+                    ax.plot(df_plot['timestamp_parsed'], df_plot['temperatura'], 
+                           marker=marcador, markersize=3, alpha=0.7)
                     ax.set_title('Serie Temporal de Temperatura')
                     ax.set_xlabel('Tiempo')
                     ax.set_ylabel('Temperatura (°C)')
@@ -826,8 +1260,8 @@ class PresentacionInteractiva:
             # Temporal: Distribución de variables
             ax = axes[1, 1]
             if 'temperatura' in df_temporal.columns and 'humedad' in df_temporal.columns:
-                ax.scatter(df_temporal['temperatura'], df_temporal['humedad'], 
-                          alpha=0.6, color='green')
+                ax.scatter(df_temporal['temperatura'].to_numpy(), df_temporal['humedad'].to_numpy(), 
+                          alpha=0.6, color='green', rasterized=True)
                 ax.set_title('Temperatura vs Humedad')
                 ax.set_xlabel('Temperatura (°C)')
                 ax.set_ylabel('Humedad (%)')
@@ -852,18 +1286,15 @@ class PresentacionInteractiva:
             mejoras.append('Datos listos para análisis')
             
             ax.text(0.1, 0.8, 'MEJORAS LOGRADAS:', fontsize=12, fontweight='bold', transform=ax.transAxes)
-            for i, mejora in enumerate(mejoras):
-                ax.text(0.1, 0.6 - i*0.1, mejora, fontsize=10, transform=ax.transAxes)
+            # Todas las líneas en un único Text (un artista en lugar de uno por línea)
+            ax.text(0.1, 0.62, '\n'.join(mejoras), fontsize=10, va='top',
+                   linespacing=2.8, transform=ax.transAxes)
             
             ax.set_xlim(0, 1)
             ax.set_ylim(0, 1)
             ax.axis('off')
             
-            plt.tight_layout()
-            plt.savefig('visualizacion_casos_practicos.png', dpi=300, bbox_inches='tight')
-            plt.show()
-            
-            print("✅ Visualización guardada como 'visualizacion_casos_practicos.png'")
+            self.finalizar_figura(fig, 'visualizacion_casos_practicos.png', huella_datos(df_ecommerce, df_temporal))
             
         except Exception as e:
             print(f"⚠️ Error creando visualización: {e}")
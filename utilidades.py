@@ -0,0 +1,113 @@
+"""
+Utilidades Compartidas de la Píldora
+====================================
+
+Funciones comunes a los módulos de la píldora, definidas una sola vez:
+1. Expresiones regulares compartidas (espacios, HTML, números, formatos)
+2. Vista previa de las tablas de las demostraciones
+3. Caché de los datasets de ejemplo
+4. Limpieza de cada valor distinto una sola vez
+5. Estilo de las visualizaciones, aplicado una sola vez
+6. Conversión de cadenas Arrow para operar con la semántica de Python
+"""
+
+import pandas as pd
+import re
+from functools import lru_cache, wraps
+
+# Secuencias de espacios en blanco
+RE_ESPACIOS = re.compile(r'\s+')
+
+# Etiquetas HTML
+RE_ETIQUETA_HTML = re.compile(r'<[^>]+>')
+
+# Entidades HTML (mismo patrón que usa html.unescape internamente)
+RE_ENTIDAD_HTML = re.compile(r'&(#[0-9]+;?|#[xX][0-9a-fA-F]+;?|[^\t\n\f <&#;]{1,32};?)')
+
+# Números dentro de un precio (con separadores de miles/decimales)
+RE_NUMERO = re.compile(r'([\d,\.]+)')
+
+# Formatos de email y de teléfono español (con prefijo opcional)
+RE_EMAIL = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+RE_TELEFONO_ESPANA = re.compile(r'^(\+34|0034|34)?[6-9]\d{8}$')
+
+# Tablas de las demostraciones: por defecto solo una vista previa, porque
+# formatear cada celda con to_string crece con el tamaño del dataset
+FILAS_VISTA_PREVIA = 10
+MOSTRAR_TABLAS_COMPLETAS = False
+
+def vista_previa(df: pd.DataFrame) -> pd.DataFrame:
+    """Devuelve el DataFrame a imprimir: completo o solo las primeras filas"""
+    if MOSTRAR_TABLAS_COMPLETAS:
+        return df
+    return df.head(FILAS_VISTA_PREVIA)
+
+def dataset_cacheado(generador):
+    """
+    Decorador para generadores deterministas de datasets de ejemplo
+    
+    El DataFrame se genera una sola vez (semilla fija) y cada llamada
+    recibe una copia, para que quien la modifique no altere la versión
+    cacheada.
+    
+    Args:
+        generador: Función sin argumentos que devuelve un DataFrame
+        
+    Returns:
+        Función que devuelve una copia del DataFrame cacheado
+    """
+    cacheado = lru_cache(maxsize=1)(generador)
+    
+    @wraps(generador)
+    def copia_del_dataset():
+        return cacheado().copy()
+    
+    return copia_del_dataset
+
+def limpiar_por_valores_unicos(serie: pd.Series, funcion) -> pd.Series:
+    """
+    Aplica una función de limpieza una sola vez por cada valor distinto
+    
+    Args:
+        serie: Serie con los valores originales (puede tener repetidos)
+        funcion: Función de limpieza que recibe un único valor
+        
+    Returns:
+        Serie con el resultado de la función para cada fila
+    """
+    # factorize agrupa los repetidos (también los nulos) en códigos enteros
+    codigos, valores_unicos = pd.factorize(serie, use_na_sentinel=False)
+    resultados = pd.Series([funcion(valor) for valor in valores_unicos])
+    
+    return pd.Series(
+        resultados.to_numpy()[codigos], index=serie.index, name=serie.name
+    )
+
+@lru_cache(maxsize=1)
+def preparar_estilo_graficos():
+    """Configura el estilo de las visualizaciones la primera vez que se dibuja"""
+    # matplotlib y seaborn solo se importan si de verdad se va a dibujar
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
+    plt.style.use('seaborn-v0_8')
+    sns.set_palette("husl")
+
+def a_cadenas_python(textos: pd.Series) -> pd.Series:
+    """
+    Convierte una serie de cadenas Arrow a cadenas de Python
+    
+    Los kernels de Arrow para title/upper transforman carácter a carácter y
+    no coinciden con str.title/str.upper de Python (p. ej. "2ºb" o "ß"): las
+    limpiezas vectorizadas que cambian mayúsculas pasan antes por aquí para
+    dar lo mismo que sus versiones fila a fila. Las demás series no cambian.
+    
+    Args:
+        textos: Serie de texto
+    
+    Returns:
+        Serie con dtype string[python] si era Arrow; si no, la misma serie
+    """
+    if isinstance(textos.dtype, pd.ArrowDtype) or getattr(textos.dtype, 'storage', None) == 'pyarrow':
+        return textos.astype('string[python]')
+    return textos